@@ -1,6 +1,6 @@
 """GTD data models for Obsidian vault integration."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -8,7 +8,7 @@ from typing import Any
 from pydantic import BaseModel, Field
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MarkdownLink:
     """Represents a markdown or wikilink in a GTD file."""
 
@@ -33,7 +33,7 @@ class GTDFrontmatter(BaseModel):
     extra: dict[str, Any] = Field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GTDTask:
     """Obsidian Tasks format with GTD methodology properties."""
 
@@ -51,7 +51,7 @@ class GTDTask:
     delegated_to: str | None = None  # 👤 person name for waiting-for items
 
     # Obsidian Tasks plugin metadata
-    tags: list[str] = field(default_factory=list)  # #task, #waiting, #someday
+    tags: tuple[str, ...] = ()  # #task, #waiting, #someday
     due_date: datetime | None = None  # 📅 YYYY-MM-DD
     scheduled_date: datetime | None = None  # ⏳ YYYY-MM-DD
     start_date: datetime | None = None  # 🛫 YYYY-MM-DD
@@ -74,6 +74,17 @@ class GTDFile:
     raw_content: str
 
 
+# GTD file type of each standard file, keyed by file name
+FILE_TYPE_BY_NAME: dict[str, str] = {
+    "inbox.md": "inbox",
+    "projects.md": "projects",
+    "next-actions.md": "next-actions",
+    "waiting-for.md": "waiting-for",
+    "someday-maybe.md": "someday-maybe",
+    "reference.md": "reference",
+}
+
+
 def detect_file_type(path: Path) -> str:
     """Detect GTD file type from path for phase-aware task recognition.
 
@@ -102,22 +113,11 @@ def detect_file_type(path: Path) -> str:
         This classification drives TaskExtractor behavior to maintain proper
         phase separation: inbox = pure capture, others = processed actionables
     """
-    # Get the file name
-    file_name = path.name
-
     # Check for standard GTD files
-    if file_name == "inbox.md":
-        return "inbox"
-    elif file_name == "projects.md":
-        return "projects"
-    elif file_name == "next-actions.md":
-        return "next-actions"
-    elif file_name == "waiting-for.md":
-        return "waiting-for"
-    elif file_name == "someday-maybe.md":
-        return "someday-maybe"
-    elif file_name == "reference.md":
-        return "reference"
+    file_name = path.name
+    file_type = FILE_TYPE_BY_NAME.get(file_name)
+    if file_type is not None:
+        return file_type
 
     # Check if it's in contexts folder
     if "contexts" in path.parts and file_name.startswith("@"):
@@ -1,6 +1,8 @@
 """LinkExtractor for parsing links from markdown text."""
 
 import re
+from collections.abc import Callable
+from operator import itemgetter
 
 from ..models import MarkdownLink
 
@@ -8,15 +10,22 @@ from ..models import MarkdownLink
 class LinkExtractor:
     """Extract links from markdown text."""
 
-    # Regex patterns for different link types
+    # Regex patterns for different link types. Bracketed patterns exclude
+    # newlines so scanning whole text matches exactly what a line-by-line
+    # scan would.
     CONTEXT_PATTERN = re.compile(r"@(\w+)")
-    WIKILINK_PATTERN = re.compile(r"\[\[([^\]]+)\]\]")
-    MARKDOWN_LINK_PATTERN = re.compile(r"\[([^\]]*)\]\(([^)]+)\)")
+    WIKILINK_PATTERN = re.compile(r"\[\[([^\]\n]+)\]\]")
+    MARKDOWN_LINK_PATTERN = re.compile(r"\[([^\]\n]*)\]\(([^)\n]+)\)")
+    EXTERNAL_URL_PATTERN = re.compile(r"^(?:https?://|ftp://|mailto:|tel:|file://)")
 
     @classmethod
     def extract_links(cls, text: str) -> list[MarkdownLink]:
         """Extract all links from markdown text.
 
+        Each pattern sweeps the whole text once; links are then ordered by
+        line, with context links, wikilinks, and markdown links in that order
+        within a line.
+
         Args:
             text: Markdown text content
 
@@ -26,82 +35,121 @@ class LinkExtractor:
         if not text or not text.strip():
             return []
 
-        links = []
-        lines = text.split("\n")
+        # Each pattern is paired with a literal every match must contain, so
+        # patterns that cannot match are skipped after a fast substring check
+        link_builders: tuple[
+            tuple[
+                str,
+                re.Pattern[str],
+                Callable[[re.Match[str], int], MarkdownLink | None],
+            ],
+            ...,
+        ] = (
+            ("@", cls.CONTEXT_PATTERN, cls._context_link),
+            ("[[", cls.WIKILINK_PATTERN, cls._wikilink),
+            ("](", cls.MARKDOWN_LINK_PATTERN, cls._markdown_link),
+        )
+
+        found = []
+        for kind, (literal, pattern, build_link) in enumerate(link_builders):
+            if literal not in text:
+                continue
 
-        for line_num, line in enumerate(lines, 1):
-            links.extend(cls._extract_line_links(line, line_num))
+            line_number = 1
+            scanned_to = 0
+            for match in pattern.finditer(text):
+                # Advance the line number incrementally from the last match
+                line_number += text.count("\n", scanned_to, match.start())
+                scanned_to = match.start()
+                if link := build_link(match, line_number):
+                    found.append((line_number, kind, match.start(), link))
 
-        return links
+        found.sort(key=itemgetter(0, 1, 2))
+        return [link for *_, link in found]
 
     @classmethod
-    def _extract_line_links(cls, line: str, line_number: int) -> list[MarkdownLink]:
-        """Extract all links from a single line.
+    def _context_link(
+        cls, match: re.Match[str], line_number: int
+    ) -> MarkdownLink | None:
+        """Build a context link (@word) from a pattern match.
 
         Args:
-            line: Single line of text
-            line_number: Line number in source text
+            match: CONTEXT_PATTERN match
+            line_number: Line number of the match in source text
 
         Returns:
-            List of MarkdownLink objects from this line
+            MarkdownLink for the context, or None if it is empty
         """
-        links = []
-
-        # Extract context links (@word)
-        for match in cls.CONTEXT_PATTERN.finditer(line):
-            context_text = match.group(1)
-            if context_text:  # Skip empty contexts
-                links.append(
-                    MarkdownLink(
-                        text=context_text,
-                        target=f"@{context_text}",
-                        is_external=False,  # Context links are internal
-                        line_number=line_number,
-                    )
-                )
-
-        # Extract wikilinks ([[text]] or [[target|display]])
-        for match in cls.WIKILINK_PATTERN.finditer(line):
-            wikilink_content = match.group(1)
-            if not wikilink_content.strip():  # Skip empty wikilinks
-                continue
+        context_text = match.group(1)
+        if not context_text:  # Skip empty contexts
+            return None
 
-            # Handle wikilink with display text [[target|display]]
-            if "|" in wikilink_content:
-                target_text, display_text = wikilink_content.split("|", 1)
-                link_text = display_text.strip()
-                target = target_text.strip()
-            else:
-                link_text = wikilink_content.strip()
-                target = wikilink_content.strip()
-
-            if link_text:  # Only create link if we have display text
-                links.append(
-                    MarkdownLink(
-                        text=link_text,
-                        target=target,
-                        is_external=False,  # Wikilinks are internal
-                        line_number=line_number,
-                    )
-                )
-
-        # Extract markdown links [text](url)
-        for match in cls.MARKDOWN_LINK_PATTERN.finditer(line):
-            link_text = match.group(1)
-            link_url = match.group(2)
-            if link_text and link_url:  # Skip empty links
-                # Determine if link is external (http/https/ftp) or internal
-                is_external = cls._is_external_url(link_url)
-                links.append(
-                    MarkdownLink(
-                        text=link_text,
-                        target=link_url,
-                        is_external=is_external,
-                        line_number=line_number,
-                    )
-                )
-
-        return links
+        return MarkdownLink(
+            text=context_text,
+            target=f"@{context_text}",
+            is_external=False,  # Context links are internal
+            line_number=line_number,
+        )
+
+    @classmethod
+    def _wikilink(cls, match: re.Match[str], line_number: int) -> MarkdownLink | None:
+        """Build a wikilink ([[text]] or [[target|display]]) from a pattern match.
+
+        Args:
+            match: WIKILINK_PATTERN match
+            line_number: Line number of the match in source text
+
+        Returns:
+            MarkdownLink for the wikilink, or None if it has no text
+        """
+        wikilink_content = match.group(1)
+        if not wikilink_content.strip():  # Skip empty wikilinks
+            return None
+
+        # Handle wikilink with display text [[target|display]]
+        if "|" in wikilink_content:
+            target_text, display_text = wikilink_content.split("|", 1)
+            link_text = display_text.strip()
+            target = target_text.strip()
+        else:
+            link_text = wikilink_content.strip()
+            target = wikilink_content.strip()
+
+        if not link_text:  # Only create link if we have display text
+            return None
+
+        return MarkdownLink(
+            text=link_text,
+            target=target,
+            is_external=False,  # Wikilinks are internal
+            line_number=line_number,
+        )
+
+    @classmethod
+    def _markdown_link(
+        cls, match: re.Match[str], line_number: int
+    ) -> MarkdownLink | None:
+        """Build a markdown link ([text](url)) from a pattern match.
+
+        Args:
+            match: MARKDOWN_LINK_PATTERN match
+            line_number: Line number of the match in source text
+
+        Returns:
+            MarkdownLink for the link, or None if its text or URL is empty
+        """
+        link_text = match.group(1)
+        link_url = match.group(2)
+        if not (link_text and link_url):  # Skip empty links
+            return None
+
+        # Determine if link is external (http/https/ftp) or internal
+        return MarkdownLink(
+            text=link_text,
+            target=link_url,
+            is_external=cls._is_external_url(link_url),
+            line_number=line_number,
+        )
 
     @classmethod
     def _is_external_url(cls, url: str) -> bool:
@@ -113,21 +161,9 @@ class LinkExtractor:
         Returns:
             True if URL is external (has protocol), False if internal/relative
         """
-        # External URLs start with protocol schemes
-        external_patterns = [
-            r"^https?://",  # HTTP/HTTPS
-            r"^ftp://",  # FTP
-            r"^mailto:",  # Email
-            r"^tel:",  # Phone
-        ]
-
-        url_lower = url.lower()
-        for pattern in external_patterns:
-            if re.match(pattern, url_lower):
-                return True
-
-        # Consider file:// URLs as external too
-        if url_lower.startswith("file://"):
+        # External URLs start with protocol schemes (HTTP/HTTPS, FTP, email,
+        # phone), and file:// URLs count as external too
+        if cls.EXTERNAL_URL_PATTERN.match(url.lower()):
             return True
 
         # Relative paths and local files are internal unless they look like file paths
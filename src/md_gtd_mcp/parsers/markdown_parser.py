@@ -34,6 +34,9 @@ class MarkdownParser:
     - contexts/@*.md: Context-specific files (#task tag required)
     """
 
+    # First level-one heading, used as the file title
+    H1_PATTERN = re.compile(r"^#\s+(.+)$", re.MULTILINE)
+
     @classmethod
     def parse_file(cls, content: str, path: Path) -> GTDFile:
         """Parse a complete GTD markdown file with phase-aware task recognition.
@@ -211,7 +214,7 @@ class MarkdownParser:
             Extracted title string
         """
         # Look for first H1 header
-        h1_match = re.search(r"^#\s+(.+)$", content, re.MULTILINE)
+        h1_match = cls.H1_PATTERN.search(content)
         if h1_match:
             return h1_match.group(1).strip()
 
@@ -28,7 +28,7 @@ class TaskExtractor:
     """
 
     # Regex patterns for parsing task components
-    TASK_LINE_PATTERN = re.compile(r"^(\s*)- \[(.)\] (.+)$", re.MULTILINE)
+    TASK_LINE_PATTERN = re.compile(r"^([^\S\n]*)- \[(.)\] (.+)$", re.MULTILINE)
 
     # GTD metadata patterns
     CONTEXT_PATTERN = re.compile(r"@(\w+)")
@@ -46,6 +46,9 @@ class TaskExtractor:
     PRIORITY_PATTERN = re.compile(r"(⏫|🔼|🔽)")
     RECURRENCE_PATTERN = re.compile(r"🔁([^#\s]+(?:\s+[^#\s]+)*?)(?=\s+#|\s*$)")
 
+    # Runs of whitespace collapsed when cleaning task text
+    WHITESPACE_PATTERN = re.compile(r"\s+")
+
     @classmethod
     def extract_tasks(cls, text: str, file_type: str | None = None) -> list[GTDTask]:
         """Extract GTD tasks from markdown text with file-type aware recognition.
@@ -79,36 +82,37 @@ class TaskExtractor:
             Reflect → Engage. Inbox items remain unprocessed until consciously
             moved through the Clarify phase where #task tags are added.
         """
-        if not text or not text.strip():
+        # Every task line contains "- [", so skip the sweep when it is absent
+        if not text or not text.strip() or "- [" not in text:
             return []
 
+        # Sweep the whole text for task lines in one pass
         tasks = []
-        lines = text.split("\n")
-
-        for line_num, line in enumerate(lines, 1):
-            if task := cls._parse_task_line(line, line_num, file_type):
+        line_number = 1
+        scanned_to = 0
+        for match in cls.TASK_LINE_PATTERN.finditer(text):
+            # Advance the line number incrementally from the last match
+            line_number += text.count("\n", scanned_to, match.start())
+            scanned_to = match.start()
+            if task := cls._parse_task_match(match, line_number, file_type):
                 tasks.append(task)
 
         return tasks
 
     @classmethod
-    def _parse_task_line(
-        cls, line: str, line_number: int, file_type: str | None = None
+    def _parse_task_match(
+        cls, match: re.Match[str], line_number: int, file_type: str | None = None
     ) -> GTDTask | None:
-        """Parse a single line for task content.
+        """Parse a matched task line for task content.
 
         Args:
-            line: Single line of text
+            match: TASK_LINE_PATTERN match covering a single line
             line_number: Line number in source text
             file_type: Optional file type to determine task recognition behavior
 
         Returns:
             GTDTask object if line contains a valid task, None otherwise
         """
-        match = cls.TASK_LINE_PATTERN.match(line)
-        if not match:
-            return None
-
         _, checkbox_state, content = match.groups()
 
         # Check if this line contains #task tag based on file type
@@ -123,7 +127,7 @@ class TaskExtractor:
         task_data.update(
             {
                 "is_completed": is_completed,
-                "raw_text": line,
+                "raw_text": match.group(0),
                 "line_number": line_number,
             }
         )
@@ -191,7 +195,7 @@ class TaskExtractor:
         delegated_to = delegated_match.group(1) if delegated_match else None
 
         # Extract Obsidian Tasks metadata
-        tags = [f"#{tag}" for tag in cls.TAG_PATTERN.findall(content)]
+        tags = tuple(f"#{tag}" for tag in cls.TAG_PATTERN.findall(content))
 
         due_date = cls._parse_date(cls.DUE_DATE_PATTERN.search(content))
         scheduled_date = cls._parse_date(cls.SCHEDULED_DATE_PATTERN.search(content))
@@ -286,6 +290,6 @@ class TaskExtractor:
         text = cls.RECURRENCE_PATTERN.sub("", text)
 
         # Clean up extra whitespace
-        text = re.sub(r"\s+", " ", text).strip()
+        text = cls.WHITESPACE_PATTERN.sub(" ", text).strip()
 
         return text
@@ -215,7 +215,7 @@ def capture_inbox_item(vault_path: str, item_text: str) -> dict[str, Any]:
 
 
 # Initialize resource handler for MCP resource templates
-resource_handler = ResourceHandler()
+resource_handler = ResourceHandler.default()
 
 
 @mcp.resource(
@@ -239,9 +239,9 @@ async def list_files_resource(vault_path: str) -> str:
 
     Returns:
         JSON string with status, lightweight file metadata (paths, types, counts),
-        summary statistics, and vault path. Does NOT include file content, task
-        details, or link details. Includes suggestion to run setup_gtd_vault if
-        no GTD structure exists.
+        file paths indexed by type, summary statistics, and vault path. Does NOT
+        include file content, task details, or link details. Includes suggestion
+        to run setup_gtd_vault if no GTD structure exists.
 
     Example Usage:
         Resource URI: gtd://path/to/vault/files
@@ -253,10 +253,7 @@ async def list_files_resource(vault_path: str) -> str:
         - Supports weekly review preparation by showing all available files
         - Ideal for understanding vault structure before detailed analysis
     """
-    import json
-
-    result = resource_handler.get_files(vault_path)
-    return json.dumps(result, indent=2)
+    return resource_handler.get_files_json(vault_path)
 
 
 @mcp.resource(
@@ -297,10 +294,7 @@ async def list_files_filtered_resource(vault_path: str, file_type: str) -> str:
         - Enables targeted processing during GTD phase transitions
         - Weekly review optimization by reviewing specific file categories
     """
-    import json
-
-    result = resource_handler.get_files(vault_path, file_type)
-    return json.dumps(result, indent=2)
+    return resource_handler.get_files_json(vault_path, file_type)
 
 
 @mcp.resource(
@@ -340,10 +334,7 @@ async def read_file_resource(vault_path: str, file_path: str) -> str:
         - Enables deep analysis of specific GTD files during reviews
         - Provides complete data for AI-assisted GTD processing
     """
-    import json
-
-    result = resource_handler.get_file(vault_path, file_path)
-    return json.dumps(result, indent=2)
+    return resource_handler.get_file_json(vault_path, file_path)
 
 
 @mcp.resource(
@@ -369,8 +360,9 @@ async def read_content_resource(vault_path: str) -> str:
     Returns:
         JSON string with status, complete files data including content, frontmatter,
         detailed tasks with all properties, links with metadata, task/link counts,
-        comprehensive summary statistics, and vault path. Provides complete GTD
-        system state for comprehensive analysis and review automation.
+        file paths indexed by type, comprehensive summary statistics, and vault
+        path. Provides complete GTD system state for comprehensive analysis and
+        review automation.
 
     Example Usage:
         Resource URI: gtd://path/to/vault/content
@@ -384,10 +376,7 @@ async def read_content_resource(vault_path: str) -> str:
         - Provides full context for automated review generation
         - Weekly review automation and stalled project detection
     """
-    import json
-
-    result = resource_handler.get_content(vault_path)
-    return json.dumps(result, indent=2)
+    return resource_handler.get_content_json(vault_path)
 
 
 @mcp.resource(
@@ -430,10 +419,7 @@ async def read_content_filtered_resource(vault_path: str, file_type: str) -> str
         - Phase-specific review automation (projects review, inbox processing)
         - Context-aware AI assistance for specific GTD categories
     """
-    import json
-
-    result = resource_handler.get_content(vault_path, file_type)
-    return json.dumps(result, indent=2)
+    return resource_handler.get_content_json(vault_path, file_type)
 
 
 def main() -> None:
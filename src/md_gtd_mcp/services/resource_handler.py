@@ -5,12 +5,55 @@ reusing existing VaultReader, MarkdownParser, and TaskExtractor services.
 Implements URI parsing and data format consistency with existing tool responses.
 """
 
+import hashlib
+import threading
 import urllib.parse
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Set
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
+import orjson
+
+from md_gtd_mcp.models.gtd_file import GTDFile, detect_file_type
 from md_gtd_mcp.models.vault_config import VaultConfig
-from md_gtd_mcp.services.vault_reader import VaultReader
+from md_gtd_mcp.services.vault_reader import (
+    DEFAULT_REJECT_PATHS,
+    VaultReader,
+    iter_md_files,
+    summarize_gtd_files,
+)
+
+# Maximum number of successful responses kept per ResourceHandler
+_RESPONSE_CACHE_SIZE = 32
+
+
+def _empty_summary() -> dict[str, Any]:
+    """Summary statistics for a vault without GTD files."""
+    return {
+        "total_files": 0,
+        "total_tasks": 0,
+        "total_links": 0,
+        "files_by_type": {},
+        "tasks_by_type": {},
+        "links_by_type": {},
+    }
+
+
+def _dumps(response: dict[str, Any]) -> str:
+    """Serialize a resource response as indented JSON for MCP transport."""
+    return orjson.dumps(
+        response, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+    ).decode()
+
+
+@dataclass(slots=True)
+class _CachedResponse:
+    """A response together with its JSON text, serialized on first use."""
+
+    response: dict[str, Any]
+    json_text: str | None = None
 
 
 class ResourceHandler:
@@ -21,6 +64,41 @@ class ResourceHandler:
     semantic correctness for MCP resource access patterns.
     """
 
+    _default: ClassVar["ResourceHandler | None"] = None
+
+    def __init__(self, reject_paths: Set[str] | None = None) -> None:
+        """Initialize ResourceHandler with an empty response cache.
+
+        Args:
+            reject_paths: Folder names skipped when walking a vault, defaulting
+                to .git, .obsidian, node_modules, and .venv
+        """
+        self._reject_paths = (
+            DEFAULT_REJECT_PATHS if reject_paths is None else frozenset(reject_paths)
+        )
+        self._response_cache: OrderedDict[tuple[Any, ...], _CachedResponse] = (
+            OrderedDict()
+        )
+        # Guards the cache and build_locks; never held while reading a vault
+        self._response_cache_lock = threading.Lock()
+        # One lock per cache key being built, so each response is built once
+        # without blocking requests for other keys
+        self._build_locks: dict[tuple[Any, ...], threading.Lock] = {}
+
+    @classmethod
+    def default(cls) -> "ResourceHandler":
+        """Return the shared handler, creating it on first use.
+
+        The handler keeps no per-request state, so one instance (and its
+        response cache) can serve every caller in the process.
+
+        Returns:
+            The process-wide ResourceHandler instance
+        """
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
     def parse_files_uri(self, uri: str) -> dict[str, Any]:
         """Parse files resource URI to extract vault path and optional file type.
 
@@ -231,6 +309,288 @@ class ResourceHandler:
 
         return {"valid": True, "resolved_path": str(file_path_obj)}
 
+    def _vault_fingerprint(self, vault_path: Path) -> str:
+        """Fingerprint the GTD folder from file metadata alone.
+
+        Walks the GTD folder and hashes the path, mtime, and size of every
+        markdown file, so any edit, addition, or removal changes the
+        fingerprint without reading file contents. The folder's own existence
+        and mtime are included too, since responses differ when it is missing.
+
+        Args:
+            vault_path: Path to the vault directory
+
+        Returns:
+            Hex digest identifying the current state of the GTD folder
+        """
+        entries = []
+        gtd_path = VaultConfig(vault_path).get_gtd_path()
+        for entry in iter_md_files(gtd_path, reject_paths=self._reject_paths):
+            try:
+                stat = entry.stat()
+            except OSError:
+                # Broken symlinks and vanished files contribute nothing
+                continue
+            entries.append((entry.path, stat.st_mtime_ns, stat.st_size))
+
+        digest = hashlib.sha256()
+        try:
+            digest.update(f"{gtd_path.stat().st_mtime_ns}\n".encode())
+        except OSError:
+            digest.update(b"missing\n")
+        for path, mtime_ns, size in sorted(entries):
+            digest.update(f"{path}\0{mtime_ns}\0{size}\n".encode())
+        return digest.hexdigest()
+
+    def _cache_entry(
+        self,
+        build: Callable[[str, str | None], dict[str, Any]],
+        vault_path: str,
+        file_type: str | None,
+    ) -> _CachedResponse:
+        """Look up a memoized response, rebuilding it when the vault changes.
+
+        Successful responses are cached under the vault's current fingerprint,
+        so repeated requests between edits skip reading and parsing. Error
+        responses are returned in an entry that is not stored. Concurrent
+        callers for the same key wait for a single build, while requests for
+        other keys proceed independently.
+
+        Args:
+            build: Uncached method producing the response
+            vault_path: Path to the Obsidian vault directory
+            file_type: Optional filter by file type
+
+        Returns:
+            Cache entry holding the response from build
+        """
+        if not self.validate_vault_path(vault_path)["valid"]:
+            return _CachedResponse(build(vault_path, file_type))
+
+        fingerprint = self._vault_fingerprint(Path(vault_path))
+        key = (build.__name__, vault_path, file_type, fingerprint)
+        with self._response_cache_lock:
+            entry = self._lookup(key)
+            if entry is not None:
+                return entry
+            build_lock = self._build_locks.setdefault(key, threading.Lock())
+
+        with build_lock:
+            with self._response_cache_lock:
+                # Another caller may have finished the build while we waited
+                entry = self._lookup(key)
+                if entry is not None:
+                    return entry
+                response = self._derived_response(
+                    build.__name__, vault_path, file_type, fingerprint
+                )
+
+            if response is None:
+                response = build(vault_path, file_type)
+            entry = _CachedResponse(response)
+
+            with self._response_cache_lock:
+                self._build_locks.pop(key, None)
+                if entry.response["status"] == "success":
+                    self._response_cache[key] = entry
+                    if len(self._response_cache) > _RESPONSE_CACHE_SIZE:
+                        self._response_cache.popitem(last=False)
+            return entry
+
+    def _lookup(self, key: tuple[Any, ...]) -> _CachedResponse | None:
+        """Return the cached entry for key, marking it most recently used.
+
+        Callers must hold the response cache lock.
+
+        Args:
+            key: Cache key of the response
+
+        Returns:
+            Cached entry, or None if the response is not cached
+        """
+        entry = self._response_cache.get(key)
+        if entry is not None:
+            self._response_cache.move_to_end(key)
+        return entry
+
+    def _derived_response(
+        self, name: str, vault_path: str, file_type: str | None, fingerprint: str
+    ) -> dict[str, Any] | None:
+        """Project a response from a cached broader one for the same vault state.
+
+        A filtered request only drops files from the unfiltered response, and a
+        get_files request only drops fields from the get_content response, so
+        either can be answered without reading the vault again.
+
+        Args:
+            name: Name of the uncached method the response is requested from
+            vault_path: Path to the Obsidian vault directory
+            file_type: Optional filter by file type
+            fingerprint: Current fingerprint of the vault's GTD folder
+
+        Returns:
+            Response identical to what the method would build, or None if no
+            cached response covers the request
+        """
+        source_names = [name]
+        if name == self._read_files.__name__:
+            source_names.append(self._read_content.__name__)
+
+        for source_name in source_names:
+            for source_type in dict.fromkeys((file_type, None)):
+                if (source_name, source_type) == (name, file_type):
+                    continue
+                source = self._response_cache.get(
+                    (source_name, vault_path, source_type, fingerprint)
+                )
+                if source is None:
+                    continue
+
+                files = source.response["files"]
+                if source_type != file_type:
+                    files = [f for f in files if f["file_type"] == file_type]
+                if source_name != name:
+                    files = [
+                        {
+                            "file_path": f["file_path"],
+                            "file_type": f["file_type"],
+                            "task_count": f["task_count"],
+                            "link_count": f["link_count"],
+                        }
+                        for f in files
+                    ]
+
+                response = {
+                    "status": "success",
+                    "files": files,
+                    "files_by_type": self._file_paths_by_type(files),
+                    # Filtered responses still summarize the whole vault
+                    "summary": source.response["summary"]
+                    if files
+                    else _empty_summary(),
+                    "vault_path": vault_path,
+                }
+                if "suggestion" in source.response:
+                    response["suggestion"] = source.response["suggestion"]
+                return response
+
+        return None
+
+    def _cached_json(
+        self,
+        build: Callable[[str, str | None], dict[str, Any]],
+        vault_path: str,
+        file_type: str | None,
+    ) -> str:
+        """Return a memoized response serialized as indented JSON.
+
+        Only the JSON text is ever handed out, so cached responses stay
+        private to the cache and need no defensive copies. The text is stored
+        alongside the cached response, so repeated requests on an unchanged
+        vault skip serialization as well as parsing.
+
+        Args:
+            build: Uncached method producing the response
+            vault_path: Path to the Obsidian vault directory
+            file_type: Optional filter by file type
+
+        Returns:
+            JSON string of the response from build
+        """
+        entry = self._cache_entry(build, vault_path, file_type)
+        if entry.json_text is None:
+            entry.json_text = _dumps(entry.response)
+        return entry.json_text
+
+    @staticmethod
+    def _file_data(gtd_file: GTDFile) -> dict[str, Any]:
+        """Convert a parsed GTD file to its full-content resource format.
+
+        Args:
+            gtd_file: Parsed GTD file
+
+        Returns:
+            Dictionary with file path, type, content, frontmatter, tasks, and
+            links, matching the read_gtd_file_impl response format
+        """
+        return {
+            "file_path": str(gtd_file.path),
+            "file_type": gtd_file.file_type,
+            "content": gtd_file.content,
+            "frontmatter": gtd_file.frontmatter.model_dump()
+            if gtd_file.frontmatter
+            else {},
+            "tasks": [
+                {
+                    "description": task.text,
+                    "completed": task.is_completed,
+                    "completion_date": task.done_date.isoformat()
+                    if task.done_date
+                    else None,
+                    "context": task.context,
+                    "project": task.project,
+                    "energy": task.energy,
+                    "time_estimate": task.time_estimate,
+                    "delegated_to": task.delegated_to,
+                    "tags": list(task.tags),
+                    "priority": task.priority,
+                    "due_date": task.due_date.isoformat() if task.due_date else None,
+                    "scheduled_date": task.scheduled_date.isoformat()
+                    if task.scheduled_date
+                    else None,
+                    "start_date": task.start_date.isoformat()
+                    if task.start_date
+                    else None,
+                    "raw_text": task.raw_text,
+                    "line_number": task.line_number,
+                }
+                for task in gtd_file.tasks
+            ],
+            "links": [
+                {
+                    "type": "external" if link.is_external else "wikilink",
+                    "text": link.text,
+                    "target": link.target,
+                    "is_external": link.is_external,
+                    "line_number": link.line_number,
+                }
+                for link in gtd_file.links
+            ],
+        }
+
+    @staticmethod
+    def _file_paths_by_type(files_data: list[dict[str, Any]]) -> dict[str, list[str]]:
+        """Index response file entries by file type.
+
+        Args:
+            files_data: File dictionaries included in a response
+
+        Returns:
+            Mapping of each file type to the paths of its files, in response
+            order
+        """
+        paths_by_type: dict[str, list[str]] = {}
+        for file_data in files_data:
+            paths_by_type.setdefault(file_data["file_type"], []).append(
+                file_data["file_path"]
+            )
+        return paths_by_type
+
+    @classmethod
+    def _content_file_data(cls, gtd_file: GTDFile) -> dict[str, Any]:
+        """Convert a parsed GTD file to the get_content per-file format.
+
+        Args:
+            gtd_file: Parsed GTD file
+
+        Returns:
+            Full-content file dictionary with task and link counts added
+        """
+        file_data = cls._file_data(gtd_file)
+        file_data["task_count"] = len(gtd_file.tasks)
+        file_data["link_count"] = len(gtd_file.links)
+        return file_data
+
     def get_files(
         self, vault_path: str, file_type: str | None = None
     ) -> dict[str, Any]:
@@ -241,10 +601,29 @@ class ResourceHandler:
             file_type: Optional filter by file type
 
         Returns:
-            Dictionary with status, lightweight file metadata, summary stats,
-            and vault path. Maintains exact format compatibility with
-            list_gtd_files_impl.
+            Dictionary with status, lightweight file metadata, file paths
+            indexed by file type, summary stats, and vault path. Maintains
+            format compatibility with list_gtd_files_impl. Built on every
+            call, so callers own the result; get_files_json serves the
+            memoized form.
         """
+        return self._read_files(vault_path, file_type)
+
+    def get_files_json(self, vault_path: str, file_type: str | None = None) -> str:
+        """Get the get_files response serialized as indented JSON.
+
+        Args:
+            vault_path: Path to the Obsidian vault directory
+            file_type: Optional filter by file type
+
+        Returns:
+            JSON string of the get_files response, reused while the vault is
+            unchanged
+        """
+        return self._cached_json(self._read_files, vault_path, file_type)
+
+    def _read_files(self, vault_path: str, file_type: str | None) -> dict[str, Any]:
+        """Build the get_files response without consulting the cache."""
         try:
             # Validate vault path
             vault_validation = self.validate_vault_path(vault_path)
@@ -289,16 +668,13 @@ class ResourceHandler:
 
             # Generate summary statistics
             try:
-                if gtd_files:
+                if gtd_files and file_type is None:
+                    # Every vault file was just read, so summarize them directly
+                    vault_summary = summarize_gtd_files(gtd_files)
+                elif gtd_files:
                     vault_summary = vault_reader.get_vault_summary()
                 else:
-                    vault_summary = {
-                        "total_files": 0,
-                        "total_tasks": 0,
-                        "total_links": 0,
-                        "files_by_type": {},
-                        "tasks_by_type": {},
-                    }
+                    vault_summary = _empty_summary()
             except Exception:
                 # Fallback summary if vault_reader fails
                 total_tasks = 0
@@ -317,12 +693,14 @@ class ResourceHandler:
                     "total_links": total_links,
                     "files_by_type": {},
                     "tasks_by_type": {},
+                    "links_by_type": {},
                 }
 
             # Prepare response
             response = {
                 "status": "success",
                 "files": files_data,
+                "files_by_type": self._file_paths_by_type(files_data),
                 "summary": vault_summary,
                 "vault_path": vault_path,
             }
@@ -388,52 +766,7 @@ class ResourceHandler:
 
             # Convert GTD file to dictionary format (exact match with
             # read_gtd_file_impl)
-            file_data = {
-                "file_path": gtd_file.path,
-                "file_type": gtd_file.file_type,
-                "content": gtd_file.content,
-                "frontmatter": gtd_file.frontmatter.model_dump()
-                if gtd_file.frontmatter
-                else {},
-                "tasks": [
-                    {
-                        "description": task.text,
-                        "completed": task.is_completed,
-                        "completion_date": task.done_date.isoformat()
-                        if task.done_date
-                        else None,
-                        "context": task.context,
-                        "project": task.project,
-                        "energy": task.energy,
-                        "time_estimate": task.time_estimate,
-                        "delegated_to": task.delegated_to,
-                        "tags": task.tags,
-                        "priority": task.priority,
-                        "due_date": task.due_date.isoformat()
-                        if task.due_date
-                        else None,
-                        "scheduled_date": task.scheduled_date.isoformat()
-                        if task.scheduled_date
-                        else None,
-                        "start_date": task.start_date.isoformat()
-                        if task.start_date
-                        else None,
-                        "raw_text": task.raw_text,
-                        "line_number": task.line_number,
-                    }
-                    for task in gtd_file.tasks
-                ],
-                "links": [
-                    {
-                        "type": "external" if link.is_external else "wikilink",
-                        "text": link.text,
-                        "target": link.target,
-                        "is_external": link.is_external,
-                        "line_number": link.line_number,
-                    }
-                    for link in gtd_file.links
-                ],
-            }
+            file_data = self._file_data(gtd_file)
 
             return {
                 "status": "success",
@@ -460,6 +793,57 @@ class ResourceHandler:
                 "vault_path": vault_path,
             }
 
+    def get_file_json(self, vault_path: str, file_path: str) -> str:
+        """Get the get_file response serialized as indented JSON.
+
+        Args:
+            vault_path: Path to the Obsidian vault directory
+            file_path: Relative path to file within vault
+
+        Returns:
+            JSON string of the get_file response
+        """
+        return _dumps(self.get_file(vault_path, file_path))
+
+    def get_file_by_type(self, vault_path: str, file_type: str) -> dict[str, Any]:
+        """Get the single GTD file of a standard type with full content.
+
+        Inbox, projects, next-actions, waiting-for, and someday-maybe each live
+        in one file at a known location, so it is read directly instead of
+        listing and parsing the whole vault first.
+
+        Args:
+            vault_path: Path to the Obsidian vault directory
+            file_type: Standard GTD file type to read
+
+        Returns:
+            Dictionary with status, file data, and vault path, in the same
+            format as get_file
+        """
+        vault_validation = self.validate_vault_path(vault_path)
+        if not vault_validation["valid"]:
+            return {
+                "status": "error",
+                "error": vault_validation["error"],
+                "vault_path": vault_path,
+            }
+
+        vault_config = VaultConfig(Path(vault_path))
+        standard_paths = {
+            detect_file_type(path): path for path in vault_config.get_all_gtd_files()
+        }
+        if file_type not in standard_paths:
+            return {
+                "status": "error",
+                "error": (
+                    f"File type '{file_type}' does not map to a single GTD file; "
+                    "use get_files to list files of this type"
+                ),
+                "vault_path": vault_path,
+            }
+
+        return self.get_file(vault_path, str(standard_paths[file_type]))
+
     def get_content(
         self, vault_path: str, file_type: str | None = None
     ) -> dict[str, Any]:
@@ -470,10 +854,29 @@ class ResourceHandler:
             file_type: Optional filter by file type
 
         Returns:
-            Dictionary with status, files with complete content, summary stats,
-            and vault path. Maintains exact format compatibility with
-            read_gtd_files_impl.
+            Dictionary with status, files with complete content, file paths
+            indexed by file type, summary stats, and vault path. Maintains
+            format compatibility with read_gtd_files_impl. Built on every
+            call, so callers own the result; get_content_json serves the
+            memoized form.
+        """
+        return self._read_content(vault_path, file_type)
+
+    def get_content_json(self, vault_path: str, file_type: str | None = None) -> str:
+        """Get the get_content response serialized as indented JSON.
+
+        Args:
+            vault_path: Path to the Obsidian vault directory
+            file_type: Optional filter by file type
+
+        Returns:
+            JSON string of the get_content response, reused while the vault is
+            unchanged
         """
+        return self._cached_json(self._read_content, vault_path, file_type)
+
+    def _read_content(self, vault_path: str, file_type: str | None) -> dict[str, Any]:
+        """Build the get_content response without consulting the cache."""
         try:
             # Validate vault path
             vault_validation = self.validate_vault_path(vault_path)
@@ -506,70 +909,17 @@ class ResourceHandler:
                 gtd_files = []
 
             # Convert GTD files to complete format with full content
-            files_data = []
-            for gtd_file in gtd_files:
-                file_data = {
-                    "file_path": str(gtd_file.path),
-                    "file_type": gtd_file.file_type,
-                    "content": gtd_file.content,
-                    "frontmatter": gtd_file.frontmatter.model_dump()
-                    if gtd_file.frontmatter
-                    else {},
-                    "tasks": [
-                        {
-                            "description": task.text,
-                            "completed": task.is_completed,
-                            "completion_date": task.done_date.isoformat()
-                            if task.done_date
-                            else None,
-                            "context": task.context,
-                            "project": task.project,
-                            "energy": task.energy,
-                            "time_estimate": task.time_estimate,
-                            "delegated_to": task.delegated_to,
-                            "tags": task.tags,
-                            "priority": task.priority,
-                            "due_date": task.due_date.isoformat()
-                            if task.due_date
-                            else None,
-                            "scheduled_date": task.scheduled_date.isoformat()
-                            if task.scheduled_date
-                            else None,
-                            "start_date": task.start_date.isoformat()
-                            if task.start_date
-                            else None,
-                            "raw_text": task.raw_text,
-                            "line_number": task.line_number,
-                        }
-                        for task in gtd_file.tasks
-                    ],
-                    "links": [
-                        {
-                            "type": "external" if link.is_external else "wikilink",
-                            "text": link.text,
-                            "target": link.target,
-                            "is_external": link.is_external,
-                            "line_number": link.line_number,
-                        }
-                        for link in gtd_file.links
-                    ],
-                    "task_count": len(gtd_file.tasks),
-                    "link_count": len(gtd_file.links),
-                }
-                files_data.append(file_data)
+            files_data = [self._content_file_data(f) for f in gtd_files]
 
             # Generate comprehensive summary statistics
             try:
-                if gtd_files:
+                if gtd_files and file_type is None:
+                    # Every vault file was just read, so summarize them directly
+                    vault_summary = summarize_gtd_files(gtd_files)
+                elif gtd_files:
                     vault_summary = vault_reader.get_vault_summary()
                 else:
-                    vault_summary = {
-                        "total_files": 0,
-                        "total_tasks": 0,
-                        "total_links": 0,
-                        "files_by_type": {},
-                        "tasks_by_type": {},
-                    }
+                    vault_summary = _empty_summary()
             except Exception:
                 # Fallback summary if vault_reader fails
                 total_tasks = 0
@@ -588,12 +938,14 @@ class ResourceHandler:
                     "total_links": total_links,
                     "files_by_type": {},
                     "tasks_by_type": {},
+                    "links_by_type": {},
                 }
 
             # Prepare comprehensive response
             response = {
                 "status": "success",
                 "files": files_data,
+                "files_by_type": self._file_paths_by_type(files_data),
                 "summary": vault_summary,
                 "vault_path": vault_path,
             }
@@ -615,3 +967,30 @@ class ResourceHandler:
                 "error": f"Unexpected error reading GTD files: {e}",
                 "vault_path": vault_path,
             }
+
+    def iter_content(
+        self, vault_path: str, file_type: str | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """Yield GTD files one at a time in the get_content per-file format.
+
+        Streaming counterpart to get_content for callers that inspect files
+        independently: only one parsed file is held in memory at a time, and
+        no summary statistics are computed.
+
+        Args:
+            vault_path: Path to the Obsidian vault directory
+            file_type: Optional filter by file type
+
+        Yields:
+            File dictionaries identical to the entries of get_content()["files"]
+
+        Raises:
+            ValueError: If the vault path is empty or does not exist
+        """
+        vault_validation = self.validate_vault_path(vault_path)
+        if not vault_validation["valid"]:
+            raise ValueError(vault_validation["error"])
+
+        vault_reader = VaultReader(VaultConfig(Path(vault_path)))
+        for gtd_file in vault_reader.iter_gtd_files(file_type=file_type):
+            yield self._content_file_data(gtd_file)
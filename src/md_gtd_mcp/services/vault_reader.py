@@ -1,10 +1,51 @@
 """VaultReader service for reading GTD vaults."""
 
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Collection, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from pathlib import Path
 
-from ..models import GTDFile, VaultConfig
+from ..models import GTDFile, VaultConfig, detect_file_type
 from ..parsers import MarkdownParser
 
+# Upper bound on threads used to read and parse files concurrently
+_MAX_READ_WORKERS = min(8, os.cpu_count() or 1)
+
+# Maximum number of parsed files kept in memory across readers
+_PARSE_CACHE_SIZE = 1024
+
+# Folder names never descended into when walking a vault
+DEFAULT_REJECT_PATHS: frozenset[str] = frozenset(
+    {".git", ".obsidian", "node_modules", ".venv"}
+)
+
+# Parsed files keyed by path, stored with the (mtime_ns, size) they were read at
+_parse_cache: OrderedDict[Path, tuple[tuple[int, int], GTDFile]] = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
+
+def _private_copy(gtd_file: GTDFile) -> GTDFile:
+    """Copy a parsed file so callers can't modify the cached parse.
+
+    Tasks and links are frozen, so only the lists holding them and the
+    frontmatter model need copying.
+
+    Args:
+        gtd_file: Parsed file as stored in the parse cache
+
+    Returns:
+        Equal GTDFile sharing no mutable state with gtd_file
+    """
+    return replace(
+        gtd_file,
+        frontmatter=gtd_file.frontmatter.model_copy(deep=True),
+        tasks=list(gtd_file.tasks),
+        links=list(gtd_file.links),
+    )
+
 
 class VaultReader:
     """Service for reading GTD files from Obsidian vaults."""
@@ -20,6 +61,10 @@ class VaultReader:
     def read_gtd_file(self, file_path: Path) -> GTDFile:
         """Read and parse a single GTD file.
 
+        Parsed files are cached by path and reused while the file's mtime and
+        size are unchanged, so repeated reads of an unchanged vault only stat
+        each file. Every call returns a private copy of the cached parse.
+
         Args:
             file_path: Path to the GTD file to read
 
@@ -30,58 +75,122 @@ class VaultReader:
             FileNotFoundError: If the file doesn't exist
             ValueError: If the file is not within the GTD folder structure
         """
-        # Validate file exists
-        if not file_path.exists():
-            raise FileNotFoundError(f"GTD file not found: {file_path}")
+        # Validate file exists; the stat also versions the parse cache below
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"GTD file not found: {file_path}") from None
 
         # Validate file is within GTD folder structure
         if not self.vault_config.is_gtd_file(file_path):
             raise ValueError(f"File {file_path} is not within GTD folder structure")
 
+        # Reuse the parsed file if it hasn't changed since it was last read
+        file_version = (stat.st_mtime_ns, stat.st_size)
+        with _parse_cache_lock:
+            cached = _parse_cache.get(file_path)
+        if cached is not None and cached[0] == file_version:
+            return _private_copy(cached[1])
+
         # Read file content
         content = file_path.read_text(encoding="utf-8")
 
         # Parse using MarkdownParser
-        return MarkdownParser.parse_file(content, file_path)
+        gtd_file = MarkdownParser.parse_file(content, file_path)
+
+        with _parse_cache_lock:
+            _parse_cache[file_path] = (file_version, gtd_file)
+            _parse_cache.move_to_end(file_path)
+            if len(_parse_cache) > _PARSE_CACHE_SIZE:
+                _parse_cache.popitem(last=False)
+
+        return _private_copy(gtd_file)
+
+    def _gtd_file_paths(self, file_type: str | None = None) -> list[Path]:
+        """Collect paths of existing GTD files in the vault.
+
+        A file's type depends only on its path, so filtering here skips
+        reading and parsing files of other types.
+
+        Args:
+            file_type: Optional filter by file type (inbox, projects, etc.)
+
+        Returns:
+            Standard GTD file paths first, followed by context file paths
+        """
+        # One directory listing replaces a stat per standard file
+        gtd_names = {
+            entry.name
+            for entry in iter_md_files(
+                self.vault_config.get_gtd_path(), recursive=False
+            )
+        }
+        paths = [
+            p for p in self.vault_config.get_all_gtd_files() if p.name in gtd_names
+        ]
+        paths.extend(
+            Path(entry.path)
+            for entry in iter_md_files(
+                self.vault_config.get_contexts_path(), recursive=False
+            )
+        )
+        if file_type:
+            paths = [p for p in paths if detect_file_type(p) == file_type]
+        return paths
+
+    def _try_read_gtd_file(self, file_path: Path) -> GTDFile | None:
+        """Read a GTD file, returning None if it can't be read or parsed.
+
+        Args:
+            file_path: Path to the GTD file to read
+
+        Returns:
+            Parsed GTDFile object, or None for unreadable files
+        """
+        try:
+            return self.read_gtd_file(file_path)
+        except Exception:
+            return None
+
+    def iter_gtd_files(self, file_type: str | None = None) -> Iterator[GTDFile]:
+        """Yield GTD files in the vault one at a time.
+
+        Files are read and parsed lazily, so callers that handle each file
+        independently never hold more than one parsed file in memory.
+
+        Args:
+            file_type: Optional filter by file type (inbox, projects, etc.)
+
+        Yields:
+            Parsed GTDFile objects, standard files first and then context files
+        """
+        for file_path in self._gtd_file_paths(file_type):
+            gtd_file = self._try_read_gtd_file(file_path)
+
+            # Skip files that can't be parsed
+            if gtd_file is not None:
+                yield gtd_file
 
     def list_gtd_files(self, file_type: str | None = None) -> list[GTDFile]:
         """List all GTD files in the vault.
 
+        Files are read and parsed on a thread pool, since reads release the
+        GIL; results keep the same order as iter_gtd_files.
+
         Args:
             file_type: Optional filter by file type (inbox, projects, etc.)
 
         Returns:
             List of parsed GTDFile objects
         """
-        gtd_files = []
-
-        # Get all standard GTD files
-        standard_files = self.vault_config.get_all_gtd_files()
-        for file_path in standard_files:
-            if file_path.exists():
-                try:
-                    gtd_file = self.read_gtd_file(file_path)
-                    gtd_files.append(gtd_file)
-                except Exception:
-                    # Skip files that can't be parsed
-                    continue
-
-        # Get context files
-        contexts_path = self.vault_config.get_contexts_path()
-        if contexts_path.exists():
-            for context_file in contexts_path.glob("*.md"):
-                try:
-                    gtd_file = self.read_gtd_file(context_file)
-                    gtd_files.append(gtd_file)
-                except Exception:
-                    # Skip files that can't be parsed
-                    continue
-
-        # Filter by file type if specified
-        if file_type:
-            gtd_files = [f for f in gtd_files if f.file_type == file_type]
+        paths = self._gtd_file_paths(file_type)
+        if len(paths) > 1:
+            with ThreadPoolExecutor(max_workers=_MAX_READ_WORKERS) as executor:
+                gtd_files = list(executor.map(self._try_read_gtd_file, paths))
+        else:
+            gtd_files = [self._try_read_gtd_file(path) for path in paths]
 
-        return gtd_files
+        return [gtd_file for gtd_file in gtd_files if gtd_file is not None]
 
     def read_all_gtd_files(self) -> list[GTDFile]:
         """Read all GTD files in the vault.
@@ -186,29 +295,78 @@ class VaultReader:
         Returns:
             Dictionary with counts of files, tasks, links by type
         """
-        all_files = self.read_all_gtd_files()
-
-        summary: dict[str, int | dict[str, int]] = {
-            "total_files": len(all_files),
-            "total_tasks": sum(len(f.tasks) for f in all_files),
-            "total_links": sum(len(f.links) for f in all_files),
-            "files_by_type": {},
-            "tasks_by_type": {},
-        }
-
-        for gtd_file in all_files:
-            file_type = gtd_file.file_type
-
-            # Count files by type
-            files_by_type = summary["files_by_type"]
-            assert isinstance(files_by_type, dict)
-            files_by_type[file_type] = files_by_type.get(file_type, 0) + 1
-
-            # Count tasks by file type
-            tasks_by_type = summary["tasks_by_type"]
-            assert isinstance(tasks_by_type, dict)
-            tasks_by_type[file_type] = tasks_by_type.get(file_type, 0) + len(
-                gtd_file.tasks
-            )
-
-        return summary
+        return summarize_gtd_files(self.read_all_gtd_files())
+
+
+def iter_md_files(
+    root: str | Path,
+    recursive: bool = True,
+    reject_paths: Collection[str] = DEFAULT_REJECT_PATHS,
+) -> Iterator[os.DirEntry[str]]:
+    """Yield directory entries for markdown files under a folder.
+
+    Uses os.scandir, so file types come from the directory listing instead of
+    a stat per entry and no Path objects are built while walking. Missing or
+    unreadable folders yield nothing.
+
+    Args:
+        root: Folder to search
+        recursive: Whether to descend into subfolders
+        reject_paths: Subfolder names to prune without descending into them
+
+    Yields:
+        Directory entries for non-directory entries whose name ends in .md
+    """
+    pending = [os.fspath(root)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as scan:
+                for entry in scan:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive and entry.name not in reject_paths:
+                            pending.append(entry.path)
+                    elif entry.name.endswith(".md"):
+                        yield entry
+        except OSError:
+            continue
+
+
+def summarize_gtd_files(
+    gtd_files: Iterable[GTDFile],
+) -> dict[str, int | dict[str, int]]:
+    """Aggregate file, task, and link counts for parsed GTD files.
+
+    Args:
+        gtd_files: Parsed GTD files to summarize
+
+    Returns:
+        Dictionary with total files, tasks, and links, plus per-type counts
+        of files, tasks, and links
+    """
+    total_files = total_tasks = total_links = 0
+    files_by_type: dict[str, int] = {}
+    tasks_by_type: dict[str, int] = {}
+    links_by_type: dict[str, int] = {}
+
+    for gtd_file in gtd_files:
+        file_type = gtd_file.file_type
+        task_count = len(gtd_file.tasks)
+        link_count = len(gtd_file.links)
+
+        total_files += 1
+        total_tasks += task_count
+        total_links += link_count
+
+        # Count files, tasks, and links by file type
+        files_by_type[file_type] = files_by_type.get(file_type, 0) + 1
+        tasks_by_type[file_type] = tasks_by_type.get(file_type, 0) + task_count
+        links_by_type[file_type] = links_by_type.get(file_type, 0) + link_count
+
+    return {
+        "total_files": total_files,
+        "total_tasks": total_tasks,
+        "total_links": total_links,
+        "files_by_type": files_by_type,
+        "tasks_by_type": tasks_by_type,
+        "links_by_type": links_by_type,
+    }
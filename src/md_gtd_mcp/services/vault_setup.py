@@ -1,7 +1,8 @@
 """GTD vault setup service for creating folder structure and template files."""
 
+import os
 from pathlib import Path
-from typing import Any
+from typing import Any, Final
 
 # GTD file content templates
 GTD_TEMPLATES = {
@@ -87,6 +88,54 @@ sort by due
 """
 
 
+# Encoded content of every template file, keyed by path relative to the vault
+TEMPLATE_FILES: Final[dict[str, bytes]] = {
+    **{
+        f"gtd/{filename}": content.encode("utf-8")
+        for filename, content in GTD_TEMPLATES.items()
+    },
+    **{
+        f"gtd/contexts/{filename}": _create_context_file_content(
+            config["title"], config["context"]
+        ).encode("utf-8")
+        for filename, config in CONTEXT_FILES.items()
+    },
+}
+
+# Flags for creating a template file, failing if anything exists at the path
+_CREATE_FLAGS: Final = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+
+
+def _create_file(name: str, data: bytes, dir_fd: int | None, vault: Path) -> bool:
+    """Create a file with the given content unless something already exists there.
+
+    Args:
+        name: File path relative to the vault
+        data: Encoded file content
+        dir_fd: Open file descriptor of the vault directory, or None where
+            the platform does not support dir_fd
+        vault: Vault directory, used to build the full path without dir_fd
+
+    Returns:
+        True if the file was created, False if it already existed
+    """
+    try:
+        if dir_fd is not None:
+            fd = os.open(name, _CREATE_FLAGS, 0o666, dir_fd=dir_fd)
+        else:
+            fd = os.open(vault / name, _CREATE_FLAGS, 0o666)
+    except FileExistsError:
+        return False
+
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+    return True
+
+
 def setup_gtd_vault(vault_path: str) -> dict[str, Any]:
     """Create GTD folder structure if missing.
 
@@ -128,26 +177,22 @@ def setup_gtd_vault(vault_path: str) -> dict[str, Any]:
         else:
             already_existed.append("gtd/contexts/")
 
-        # Create standard GTD files
-        for filename, content in GTD_TEMPLATES.items():
-            file_path = gtd_path / filename
-            if not file_path.exists():
-                file_path.write_text(content)
-                created.append(f"gtd/{filename}")
-            else:
-                already_existed.append(f"gtd/{filename}")
-
-        # Create context files
-        for filename, config in CONTEXT_FILES.items():
-            file_path = contexts_path / filename
-            if not file_path.exists():
-                content = _create_context_file_content(
-                    config["title"], config["context"]
-                )
-                file_path.write_text(content)
-                created.append(f"gtd/contexts/{filename}")
-            else:
-                already_existed.append(f"gtd/contexts/{filename}")
+        # Create standard GTD files and context files. O_EXCL makes the
+        # existence check and creation a single step, so existing files are
+        # never overwritten.
+        if os.open in os.supports_dir_fd:
+            dir_fd: int | None = os.open(vault, os.O_RDONLY | os.O_DIRECTORY)
+        else:
+            dir_fd = None
+        try:
+            for name, data in TEMPLATE_FILES.items():
+                if _create_file(name, data, dir_fd, vault):
+                    created.append(name)
+                else:
+                    already_existed.append(name)
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
 
         return {
             "status": "success",
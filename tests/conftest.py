@@ -0,0 +1,111 @@
+"""Shared pytest configuration for the GTD MCP test suite."""
+
+import hashlib
+import importlib.metadata
+import shutil
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+
+import md_gtd_mcp
+import tests.fixtures
+from md_gtd_mcp.models import VaultConfig
+from tests.fixtures import get_sample_vault_path
+
+# Whether the test body ("call" phase) of an item passed
+_CALL_PASSED = pytest.StashKey[bool]()
+
+# Installed distributions whose behaviour the vault parsers depend on
+_PARSER_DISTRIBUTIONS = ("pydantic", "PyYAML", "python-frontmatter")
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register command line options for the test suite."""
+    parser.addoption(
+        "--vault-cache",
+        action="store_true",
+        default=False,
+        help="Skip sample vault validation tests whose inputs are unchanged "
+        "since their last green run",
+    )
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_makereport(
+    item: pytest.Item, call: pytest.CallInfo[None]
+) -> Generator[None, pytest.TestReport, pytest.TestReport]:
+    """Record the outcome of each test body for fixtures to inspect."""
+    report = yield
+    if report.when == "call":
+        item.stash[_CALL_PASSED] = report.passed
+    return report
+
+
+def _vault_validation_digest(test_file: Path, node_id: str) -> str:
+    """Hash everything a sample vault validation test depends on.
+
+    Covers the sample vault files, the package sources that parse them, the
+    test module, the shared fixture helpers and this conftest, and the
+    installed versions of the parsing libraries, so any change to inputs or
+    logic forces a rerun.
+    """
+    digest = hashlib.sha1(node_id.encode())
+    vault_path = get_sample_vault_path()
+    package_path = Path(md_gtd_mcp.__file__).parent
+    sources = [
+        *sorted(vault_path.rglob("*.md")),
+        *sorted(package_path.rglob("*.py")),
+        test_file,
+        Path(tests.fixtures.__file__),
+        Path(__file__),
+    ]
+    for source in sources:
+        digest.update(source.as_posix().encode())
+        digest.update(source.read_bytes())
+    for distribution in _PARSER_DISTRIBUTIONS:
+        try:
+            version = importlib.metadata.version(distribution)
+        except importlib.metadata.PackageNotFoundError:
+            version = "missing"
+        digest.update(f"{distribution}=={version}\n".encode())
+    return digest.hexdigest()
+
+
+@pytest.fixture
+def vault_green_cache(request: pytest.FixtureRequest) -> Generator[None]:
+    """Skip a read-only sample vault test that already passed on these inputs.
+
+    Only active with ``--vault-cache`` and pytest's cache provider enabled, so
+    CI runs and default local runs always execute the test.
+    """
+    cache = getattr(request.config, "cache", None)
+    if cache is None or not request.config.getoption("--vault-cache"):
+        yield
+        return
+
+    key = "vault_green/" + _vault_validation_digest(
+        request.node.path, request.node.nodeid
+    )
+    if cache.get(key, False):
+        pytest.skip("sample vault and validation logic unchanged since last pass")
+
+    yield
+
+    if request.node.stash.get(_CALL_PASSED, False):
+        cache.set(key, True)
+
+
+@pytest.fixture(scope="session")
+def shared_sample_vault(tmp_path_factory: pytest.TempPathFactory) -> VaultConfig:
+    """Provide one sample vault copy shared by every read-only test.
+
+    The copy lives under pytest's base temp directory, which is separate for
+    each pytest-xdist worker, so parallel runs never share a vault.
+
+    Tests using this fixture must not modify the vault; use
+    ``create_sample_vault()`` for tests that write to it.
+    """
+    vault_path = tmp_path_factory.mktemp("shared") / "sample_vault"
+    shutil.copytree(get_sample_vault_path(), vault_path)
+    return VaultConfig(vault_path)
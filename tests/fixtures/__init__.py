@@ -1,6 +1,8 @@
 """Test fixtures for GTD vault testing."""
 
+import os
 import shutil
+import sys
 import tempfile
 from collections.abc import Generator
 from contextlib import contextmanager
@@ -8,6 +10,16 @@ from pathlib import Path
 
 from md_gtd_mcp.models import VaultConfig
 
+# Memory-backed parent for test vaults on Linux; None uses the platform default.
+# Set MD_GTD_TEST_TMPFS=0 to keep test vaults in the platform temp directory.
+TEST_TMP_DIR: str | None = (
+    "/dev/shm"
+    if os.environ.get("MD_GTD_TEST_TMPFS", "1") != "0"
+    and sys.platform == "linux"
+    and os.access("/dev/shm", os.W_OK | os.X_OK)
+    else None
+)
+
 
 @contextmanager
 def create_sample_vault() -> Generator[VaultConfig]:
@@ -20,7 +32,7 @@ def create_sample_vault() -> Generator[VaultConfig]:
         VaultConfig pointing to the temporary vault with sample data
     """
     # Create temporary directory
-    temp_dir = tempfile.mkdtemp()
+    temp_dir = tempfile.mkdtemp(dir=TEST_TMP_DIR)
     temp_vault_path = Path(temp_dir) / "sample_vault"
 
     try:
@@ -1,8 +1,11 @@
 """Tests for GTD data models."""
 
+from dataclasses import FrozenInstanceError, replace
 from datetime import datetime
 from pathlib import Path
 
+import pytest
+
 from md_gtd_mcp.models.gtd_file import (
     GTDFile,
     GTDFrontmatter,
@@ -39,6 +42,22 @@ class TestMarkdownLink:
         assert link.is_external is False
         assert link.target == "[[Project Name]]"
 
+    def test_markdown_link_is_slotted(self) -> None:
+        """Test links use slots rather than a per-instance dict."""
+        link = MarkdownLink(
+            text="Project Name",
+            target="[[Project Name]]",
+            is_external=False,
+            line_number=10,
+        )
+        assert not hasattr(link, "__dict__")
+        assert MarkdownLink.__slots__ == (
+            "text",
+            "target",
+            "is_external",
+            "line_number",
+        )
+
 
 class TestGTDFrontmatter:
     """Test GTDFrontmatter data model."""
@@ -101,13 +120,13 @@ class TestGTDTask:
             project="Q1 Planning",
             energy="high",
             time_estimate=30,
-            tags=["task"],
+            tags=("task",),
         )
         assert task.context == "@office"
         assert task.project == "Q1 Planning"
         assert task.energy == "high"
         assert task.time_estimate == 30
-        assert task.tags == ["task"]
+        assert task.tags == ("task",)
 
     def test_task_with_obsidian_metadata(self) -> None:
         """Test task with Obsidian Tasks plugin metadata."""
@@ -118,7 +137,7 @@ class TestGTDTask:
             line_number=15,
             due_date=datetime(2025, 1, 20),
             priority="high",
-            tags=["task"],
+            tags=("task",),
         )
         assert task.due_date == datetime(2025, 1, 20)
         assert task.priority == "high"
@@ -143,11 +162,24 @@ class TestGTDTask:
             raw_text="- [ ] Budget approval 👤 John #waiting",
             line_number=25,
             delegated_to="John",
-            tags=["waiting"],
+            tags=("waiting",),
         )
         assert task.delegated_to == "John"
         assert "waiting" in task.tags
 
+    def test_task_is_slotted_and_frozen(self) -> None:
+        """Test parsed tasks are compact and cannot be reassigned in place."""
+        task = GTDTask(
+            text="Call dentist",
+            is_completed=False,
+            raw_text="- [ ] Call dentist",
+            line_number=1,
+        )
+        assert not hasattr(task, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            task.is_completed = True  # type: ignore[misc]
+        assert hash(task) == hash(replace(task))
+
 
 class TestGTDFile:
     """Test GTDFile data model."""
@@ -206,6 +238,10 @@ class TestFileTypeDetection:
         """Test detecting someday-maybe file."""
         assert detect_file_type(Path("gtd/someday-maybe.md")) == "someday-maybe"
 
+    def test_detect_reference(self) -> None:
+        """Test detecting reference file."""
+        assert detect_file_type(Path("gtd/reference.md")) == "reference"
+
     def test_detect_context_file(self) -> None:
         """Test detecting context files."""
         assert detect_file_type(Path("gtd/contexts/@calls.md")) == "context"
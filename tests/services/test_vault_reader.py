@@ -1,12 +1,15 @@
 """Tests for VaultReader service."""
 
 import tempfile
+from collections.abc import Iterator
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from md_gtd_mcp.models import VaultConfig
-from md_gtd_mcp.services.vault_reader import VaultReader
+from md_gtd_mcp.parsers import MarkdownParser
+from md_gtd_mcp.services.vault_reader import VaultReader, iter_md_files
 
 
 class TestVaultReader:
@@ -201,6 +204,48 @@ context: errands
         assert len(gtd_file.tasks) == 3  # Only tasks with #task tag
         assert len(gtd_file.links) >= 3  # @calls, @errands, [[Project Alpha]]
 
+    def test_read_gtd_file_reuses_unchanged_parse(self) -> None:
+        """Test re-reading an unchanged file reuses the earlier parse."""
+        reader = VaultReader(self.vault_config)
+        inbox_path = self.vault_config.get_inbox_path()
+
+        first_read = reader.read_gtd_file(inbox_path)
+        with patch.object(Path, "read_text") as read_text:
+            second_read = VaultReader(self.vault_config).read_gtd_file(inbox_path)
+
+        read_text.assert_not_called()
+        assert second_read == first_read
+
+    def test_read_gtd_file_callers_cannot_modify_cached_parse(self) -> None:
+        """Test changes to a returned file do not leak into later reads."""
+        reader = VaultReader(self.vault_config)
+        inbox_path = self.vault_config.get_inbox_path()
+
+        expected = MarkdownParser.parse_file(
+            inbox_path.read_text(encoding="utf-8"), inbox_path
+        )
+
+        first_read = reader.read_gtd_file(inbox_path)
+        first_read.tasks.clear()
+        first_read.links.clear()
+        first_read.frontmatter.tags.append("mutated")
+
+        assert reader.read_gtd_file(inbox_path) == expected
+
+    def test_read_gtd_file_reparses_changed_file(self) -> None:
+        """Test a modified file is parsed again instead of served from cache."""
+        reader = VaultReader(self.vault_config)
+        inbox_path = self.vault_config.get_inbox_path()
+
+        first_read = reader.read_gtd_file(inbox_path)
+        inbox_path.write_text(
+            inbox_path.read_text() + "- [ ] Newly captured item #task\n"
+        )
+        second_read = reader.read_gtd_file(inbox_path)
+
+        assert second_read is not first_read
+        assert len(second_read.tasks) == len(first_read.tasks) + 1
+
     def test_read_gtd_file_not_found(self) -> None:
         """Test reading non-existent GTD file."""
         reader = VaultReader(self.vault_config)
@@ -265,6 +310,40 @@ context: errands
         assert len(project_files) == 1
         assert project_files[0].file_type == "projects"
 
+    def test_list_gtd_files_by_type_reads_only_matching_files(self) -> None:
+        """Test a type filter is applied to paths before any file is read."""
+        reader = VaultReader(self.vault_config)
+
+        with patch.object(
+            VaultReader,
+            "read_gtd_file",
+            autospec=True,
+            wraps=VaultReader.read_gtd_file,
+        ) as mock_read:
+            inbox_files = reader.list_gtd_files(file_type="inbox")
+
+        assert [f.file_type for f in inbox_files] == ["inbox"]
+        read_paths = [call.args[1] for call in mock_read.call_args_list]
+        assert read_paths == [self.vault_config.get_inbox_path()]
+
+    def test_iter_gtd_files(self) -> None:
+        """Test streaming GTD files yields the same files as listing them."""
+        reader = VaultReader(self.vault_config)
+
+        gtd_files = reader.iter_gtd_files()
+
+        # Files are produced lazily, in the same order as list_gtd_files
+        assert isinstance(gtd_files, Iterator)
+        streamed_paths = [gtd_file.path for gtd_file in gtd_files]
+        listed_paths = [gtd_file.path for gtd_file in reader.list_gtd_files()]
+        assert streamed_paths == listed_paths
+
+        # Filtering by type applies while streaming
+        context_files = list(reader.iter_gtd_files(file_type="context"))
+        assert len(context_files) == 3
+        for context_file in context_files:
+            assert context_file.file_type == "context"
+
     def test_read_all_gtd_files(self) -> None:
         """Test reading all GTD files in vault."""
         reader = VaultReader(self.vault_config)
@@ -474,6 +553,27 @@ context: errands
         assert str(self.vault_config.get_inbox_path()) in file_paths
         assert str(self.vault_config.get_projects_path()) in file_paths
 
+    def test_get_vault_summary(self) -> None:
+        """Test vault summary totals agree with per-type breakdowns."""
+        reader = VaultReader(self.vault_config)
+        all_files = reader.read_all_gtd_files()
+
+        summary = reader.get_vault_summary()
+
+        assert summary["total_files"] == len(all_files)
+        assert summary["total_tasks"] == sum(len(f.tasks) for f in all_files)
+        assert summary["total_links"] == sum(len(f.links) for f in all_files)
+        assert summary["files_by_type"]["context"] == 3
+        assert summary["tasks_by_type"]["inbox"] == 3
+        for key, total_key in [
+            ("files_by_type", "total_files"),
+            ("tasks_by_type", "total_tasks"),
+            ("links_by_type", "total_links"),
+        ]:
+            by_type = summary[key]
+            assert isinstance(by_type, dict)
+            assert sum(by_type.values()) == summary[total_key]
+
     def test_vault_reader_integration_with_parsers(self) -> None:
         """Test integration between VaultReader and all parser components."""
         reader = VaultReader(self.vault_config)
@@ -516,3 +616,46 @@ context: errands
         gtd_file = reader.read_gtd_file(corrupted_path)
         assert gtd_file.title == "Corrupted"
         # Frontmatter parsing should fail gracefully
+
+
+class TestIterMdFiles:
+    """Test the os.scandir-based markdown file walker."""
+
+    def test_iter_md_files(self) -> None:
+        """Test walking finds markdown files, optionally in subfolders."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            (root / "top.md").write_text("# Top")
+            (root / "notes.txt").write_text("not markdown")
+            (root / "folder.md").mkdir()
+            (root / "nested").mkdir()
+            (root / "nested" / "deep.md").write_text("# Deep")
+
+            recursive_names = {entry.name for entry in iter_md_files(root)}
+            flat_names = {entry.name for entry in iter_md_files(root, recursive=False)}
+
+            assert recursive_names == {"top.md", "deep.md"}
+            assert flat_names == {"top.md"}
+
+    def test_iter_md_files_prunes_rejected_folders(self) -> None:
+        """Test tooling folders are skipped unless the reject list changes."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            (root / "kept.md").write_text("# Kept")
+            for folder in (".git", ".obsidian", "node_modules", ".venv"):
+                (root / folder).mkdir()
+                (root / folder / "ignored.md").write_text("# Ignored")
+
+            default_names = {entry.name for entry in iter_md_files(root)}
+            custom_names = {
+                Path(entry.path).parent.name
+                for entry in iter_md_files(root, reject_paths={".git"})
+            }
+
+            assert default_names == {"kept.md"}
+            assert custom_names == {root.name, ".obsidian", "node_modules", ".venv"}
+
+    def test_iter_md_files_missing_folder(self) -> None:
+        """Test walking a missing folder yields nothing."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            assert list(iter_md_files(Path(temp_dir) / "missing")) == []
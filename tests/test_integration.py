@@ -1,8 +1,14 @@
 """Integration tests for GTD MCP server components."""
 
+import re
 import tempfile
+from dataclasses import dataclass
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple, TypedDict
+
+import pytest
+from pydantic import TypeAdapter, ValidationError
 
 from md_gtd_mcp.models.vault_config import VaultConfig
 from md_gtd_mcp.services.resource_handler import ResourceHandler
@@ -10,221 +16,318 @@ from md_gtd_mcp.services.vault_reader import VaultReader
 from md_gtd_mcp.services.vault_setup import setup_gtd_vault
 from tests.fixtures import create_sample_vault
 
+# Extracts the file path from a file entry in resource responses
+_get_file_path = itemgetter("file_path")
 
-class TestGTDIntegration:
-    """Integration tests for all parser components with VaultReader."""
 
-    def test_complete_vault_reading_integration(self) -> None:
-        """Test complete integration of all parsers with realistic GTD vault."""
-        with create_sample_vault() as vault_config:
-            reader = VaultReader(vault_config)
+class _LinkShape(TypedDict):
+    """Required keys and value types of a link in resource responses."""
 
-            # Read all files and verify integration
-            all_files = reader.read_all_gtd_files()
+    text: str
+    target: str
+    is_external: bool
+    line_number: int
 
-            # Should have all GTD file types
-            assert len(all_files) >= 8  # 5 standard + 3+ context files
 
-            file_types = {f.file_type for f in all_files}
-            expected_types = {
-                "inbox",
-                "projects",
-                "next-actions",
-                "waiting-for",
-                "someday-maybe",
-                "context",
-            }
-            assert expected_types.issubset(file_types)
+# Validates whole link lists at once; strict mode rejects coerced values
+_LINK_LIST_ADAPTER = TypeAdapter(list[_LinkShape])
+
+
+class _Link(NamedTuple):
+    """Validated link fields with attribute access for the value checks."""
+
+    text: str
+    target: str
+    is_external: bool
+    line_number: int
+
+    @classmethod
+    def from_dict(cls, link: dict[str, Any]) -> "_Link":
+        """Build a record from a link dict in a resource response."""
+        return cls(
+            link["text"], link["target"], link["is_external"], link["line_number"]
+        )
+
+
+# URL schemes that internal (vault) links must never carry, in any case
+_INTERNAL_FORBIDDEN_SCHEME_RE = re.compile(r"^(?:https?|ftp)://", re.IGNORECASE)
+
+# Target shapes accepted for links classified as external
+_EXTERNAL_TARGET_RE = re.compile(
+    r"^(?:https?://|mailto:|ftp://|\./|\.\./)|\.md$", re.IGNORECASE
+)
+
+# Obsidian Tasks query markers, found together in a single scan of a context file
+_TASKS_QUERY_MARKER_RE = re.compile(r"```tasks|(?:not )?done")
+
+
+def _has_valid_link_values(link: _Link) -> bool:
+    """Check that a link has non-empty text and target and a positive line."""
+    return bool(link.text) and bool(link.target) and link.line_number > 0
+
+
+def _link_errors(links: list[_Link]) -> list[str]:
+    """Describe links in one file with empty values or mismatched targets."""
+    errors = []
+    for link in links:
+        if not _has_valid_link_values(link):
+            errors.append(f"Invalid link: {link}")
+            continue
+        target = link.target
+        if link.is_external:
+            if not _EXTERNAL_TARGET_RE.search(target):
+                errors.append(f"External link '{target}' has invalid format")
+        elif _INTERNAL_FORBIDDEN_SCHEME_RE.match(target):
+            errors.append(f"Internal link '{target}' has a URL scheme")
+    return errors
+
 
-    def test_task_extraction_across_files(self) -> None:
+@dataclass(slots=True)
+class _ContextFileProbe:
+    """Facts about one context file, derived in a single pass over it."""
+
+    file_path: str
+    has_tasks_block: bool
+    has_query_criterion: bool
+    references_self: bool
+
+    @classmethod
+    def from_file_data(cls, file_data: dict[str, Any]) -> "_ContextFileProbe":
+        """Probe a context file from a get_content response entry."""
+        file_path = file_data["file_path"]
+        content = file_data["content"]
+        markers = set(_TASKS_QUERY_MARKER_RE.findall(content))
+
+        # e.g. ".../contexts/@calls.md" -> "@calls". The parser has already
+        # extracted context links, so check those before scanning the content.
+        context_name = file_path.rpartition("/")[2].removesuffix(".md")
+        referenced_targets = {link["target"] for link in file_data["links"]}
+
+        return cls(
+            file_path=file_path,
+            has_tasks_block="```tasks" in markers,
+            has_query_criterion=bool(markers & {"not done", "done"}),
+            references_self=(
+                context_name in referenced_targets or context_name in content
+            ),
+        )
+
+
+class TestGTDIntegration:
+    """Integration tests for all parser components with VaultReader."""
+
+    def test_complete_vault_reading_integration(
+        self, shared_sample_vault: VaultConfig
+    ) -> None:
+        """Test complete integration of all parsers with realistic GTD vault."""
+        reader = VaultReader(shared_sample_vault)
+
+        # Read all files and verify integration
+        all_files = reader.read_all_gtd_files()
+
+        # Should have all GTD file types
+        assert len(all_files) >= 8  # 5 standard + 3+ context files
+
+        file_types = {f.file_type for f in all_files}
+        expected_types = {
+            "inbox",
+            "projects",
+            "next-actions",
+            "waiting-for",
+            "someday-maybe",
+            "context",
+        }
+        assert expected_types.issubset(file_types)
+
+    def test_task_extraction_across_files(
+        self, shared_sample_vault: VaultConfig
+    ) -> None:
         """Test TaskExtractor integration across different file types."""
-        with create_sample_vault() as vault_config:
-            reader = VaultReader(vault_config)
+        reader = VaultReader(shared_sample_vault)
 
-            # Get files that should contain tasks
-            task_files = reader.find_files_with_tasks()
+        # Get files that should contain tasks
+        task_files = reader.find_files_with_tasks()
 
-            # Should have tasks in inbox and next-actions primarily
-            task_file_types = {f.file_type for f in task_files}
-            expected_task_types = {"inbox", "next-actions"}
-            assert expected_task_types.issubset(task_file_types)
+        # Should have tasks in inbox and next-actions primarily
+        task_file_types = {f.file_type for f in task_files}
+        expected_task_types = {"inbox", "next-actions"}
+        assert expected_task_types.issubset(task_file_types)
 
-            # Count total actionable tasks (#task tag)
-            total_tasks = sum(len(f.tasks) for f in task_files)
-            assert total_tasks > 20  # Should have many consolidated tasks
+        # Count total actionable tasks (#task tag)
+        total_tasks = sum(len(f.tasks) for f in task_files)
+        assert total_tasks > 20  # Should have many consolidated tasks
 
-    def test_context_file_query_parsing(self) -> None:
+    def test_context_file_query_parsing(self, shared_sample_vault: VaultConfig) -> None:
         """Test that context files with query blocks are parsed gracefully."""
-        with create_sample_vault() as vault_config:
-            reader = VaultReader(vault_config)
+        reader = VaultReader(shared_sample_vault)
 
-            # Get context files
-            context_files = reader.get_context_files()
-            assert len(context_files) == 4  # @calls, @computer, @errands, @home
+        # Get context files
+        context_files = reader.get_context_files()
+        assert len(context_files) == 4  # @calls, @computer, @errands, @home
 
-            for context_file in context_files:
-                # Context files should parse without errors
-                title_check = (
-                    context_file.title.startswith("@")
-                    or "Context" in context_file.title
-                )
-                assert title_check
-                assert context_file.file_type == "context"
-                assert context_file.content is not None
+        for context_file in context_files:
+            # Context files should parse without errors
+            title_check = (
+                context_file.title.startswith("@") or "Context" in context_file.title
+            )
+            assert title_check
+            assert context_file.file_type == "context"
+            assert context_file.content is not None
 
-                # Should not extract tasks from query blocks
-                # (Query blocks are code blocks, not task checkboxes)
-                assert len(context_file.tasks) == 0
+            # Should not extract tasks from query blocks
+            # (Query blocks are code blocks, not task checkboxes)
+            assert len(context_file.tasks) == 0
 
-    def test_link_extraction_across_files(self) -> None:
+    def test_link_extraction_across_files(
+        self, shared_sample_vault: VaultConfig
+    ) -> None:
         """Test LinkExtractor integration for wikilinks and context links."""
-        with create_sample_vault() as vault_config:
-            reader = VaultReader(vault_config)
+        reader = VaultReader(shared_sample_vault)
 
-            all_files = reader.read_all_gtd_files()
+        all_files = reader.read_all_gtd_files()
 
-            # Collect all links
-            all_links = []
-            for f in all_files:
-                all_links.extend(f.links)
+        # Collect all links
+        all_links = []
+        for f in all_files:
+            all_links.extend(f.links)
 
-            assert len(all_links) > 0
+        assert len(all_links) > 0
 
-            # Should have various link types
-            wikilinks = [link for link in all_links if not link.is_external]
-            context_links = [link for link in all_links if link.target.startswith("@")]
+        # Should have various link types
+        wikilinks = [link for link in all_links if not link.is_external]
+        context_links = [link for link in all_links if link.target.startswith("@")]
 
-            assert len(wikilinks) > 0
-            assert len(context_links) > 0
+        assert len(wikilinks) > 0
+        assert len(context_links) > 0
 
-    def test_next_actions_as_primary_task_source(self) -> None:
+    def test_next_actions_as_primary_task_source(
+        self, shared_sample_vault: VaultConfig
+    ) -> None:
         """Test that next-actions.md is the primary source of actionable tasks."""
-        with create_sample_vault() as vault_config:
-            reader = VaultReader(vault_config)
+        reader = VaultReader(shared_sample_vault)
 
-            # Get next-actions file
-            next_actions_files = reader.get_gtd_files_by_type("next-actions")
-            assert len(next_actions_files) == 1
+        # Get next-actions file
+        next_actions_files = reader.get_gtd_files_by_type("next-actions")
+        assert len(next_actions_files) == 1
 
-            next_actions = next_actions_files[0]
+        next_actions = next_actions_files[0]
 
-            # Should have the most tasks with proper context tags
-            assert len(next_actions.tasks) > 15  # Consolidated from all contexts
+        # Should have the most tasks with proper context tags
+        assert len(next_actions.tasks) > 15  # Consolidated from all contexts
 
-            # Check that tasks have proper context information
-            # Context is extracted into task.context field, not task.text
-            task_contexts = [
-                task.context for task in next_actions.tasks if task.context
-            ]
-            context_tags = ["@calls", "@computer", "@errands", "@home"]
+        # Check that tasks have proper context information
+        # Context is extracted into task.context field, not task.text
+        task_contexts = [task.context for task in next_actions.tasks if task.context]
+        context_tags = ["@calls", "@computer", "@errands", "@home"]
 
-            # Should have tasks for each context
-            for context_tag in context_tags:
-                assert any(context == context_tag for context in task_contexts)
+        # Should have tasks for each context
+        for context_tag in context_tags:
+            assert any(context == context_tag for context in task_contexts)
 
-    def test_inbox_processing_states(self) -> None:
+    def test_inbox_processing_states(self, shared_sample_vault: VaultConfig) -> None:
         """Test that inbox shows mixed processing states."""
-        with create_sample_vault() as vault_config:
-            reader = VaultReader(vault_config)
+        reader = VaultReader(shared_sample_vault)
 
-            inbox_files = reader.get_inbox_files()
-            assert len(inbox_files) == 1
+        inbox_files = reader.get_inbox_files()
+        assert len(inbox_files) == 1
 
-            inbox = inbox_files[0]
+        inbox = inbox_files[0]
 
-            # With GTD phase-aware recognition, inbox recognizes ALL checkbox items
-            # This is correct GTD behavior - capture phase doesn't require #task tags
-            # The test fixture has 18 checkbox items total
-            assert len(inbox.tasks) >= 15  # Should capture most/all checkbox items
-            assert len(inbox.tasks) <= 20  # Reasonable upper bound
+        # With GTD phase-aware recognition, inbox recognizes ALL checkbox items
+        # This is correct GTD behavior - capture phase doesn't require #task tags
+        # The test fixture has 18 checkbox items total
+        assert len(inbox.tasks) >= 15  # Should capture most/all checkbox items
+        assert len(inbox.tasks) <= 20  # Reasonable upper bound
 
-            # Verify that we're actually capturing tasks without #task tags
-            # (this is the key improvement from Decision D006)
-            processed_tasks = len(inbox.tasks)
-            assert (
-                processed_tasks >= 15
-            )  # Significant number of captured items  # But reasonable number for inbox
+        # Verify that we're actually capturing tasks without #task tags
+        # (this is the key improvement from Decision D006)
+        processed_tasks = len(inbox.tasks)
+        assert (
+            processed_tasks >= 15
+        )  # Significant number of captured items  # But reasonable number for inbox
 
-    def test_project_references_not_duplicates(self) -> None:
+    def test_project_references_not_duplicates(
+        self, shared_sample_vault: VaultConfig
+    ) -> None:
         """Test that projects file references tasks rather than duplicating them."""
-        with create_sample_vault() as vault_config:
-            reader = VaultReader(vault_config)
+        reader = VaultReader(shared_sample_vault)
 
-            project_files = reader.get_project_files()
-            assert len(project_files) == 1
+        project_files = reader.get_project_files()
+        assert len(project_files) == 1
 
-            projects = project_files[0]
+        projects = project_files[0]
 
-            # Projects file should have very few or no tasks
-            # (just references and project metadata)
-            assert len(projects.tasks) == 0  # No duplicated tasks
+        # Projects file should have very few or no tasks
+        # (just references and project metadata)
+        assert len(projects.tasks) == 0  # No duplicated tasks
 
-            # Should have links to other files
-            assert len(projects.links) > 0
+        # Should have links to other files
+        assert len(projects.links) > 0
 
-    def test_waiting_for_categorization(self) -> None:
+    def test_waiting_for_categorization(self, shared_sample_vault: VaultConfig) -> None:
         """Test that waiting-for items are properly categorized."""
-        with create_sample_vault() as vault_config:
-            reader = VaultReader(vault_config)
+        reader = VaultReader(shared_sample_vault)
 
-            waiting_files = reader.get_waiting_for_files()
-            assert len(waiting_files) == 1
+        waiting_files = reader.get_waiting_for_files()
+        assert len(waiting_files) == 1
 
-            waiting_for = waiting_files[0]
+        waiting_for = waiting_files[0]
 
-            # Waiting items should not be extracted as actionable tasks
-            # (they have #waiting tag, not #task tag)
-            assert len(waiting_for.tasks) == 0
+        # Waiting items should not be extracted as actionable tasks
+        # (they have #waiting tag, not #task tag)
+        assert len(waiting_for.tasks) == 0
 
-    def test_someday_maybe_categorization(self) -> None:
+    def test_someday_maybe_categorization(
+        self, shared_sample_vault: VaultConfig
+    ) -> None:
         """Test that someday/maybe items are properly categorized."""
-        with create_sample_vault() as vault_config:
-            reader = VaultReader(vault_config)
+        reader = VaultReader(shared_sample_vault)
 
-            someday_files = reader.get_someday_files()
-            assert len(someday_files) == 1
+        someday_files = reader.get_someday_files()
+        assert len(someday_files) == 1
 
-            someday = someday_files[0]
+        someday = someday_files[0]
 
-            # Someday items should not be extracted as actionable tasks
-            # (they have #someday tag, not #task tag)
-            assert len(someday.tasks) == 0
+        # Someday items should not be extracted as actionable tasks
+        # (they have #someday tag, not #task tag)
+        assert len(someday.tasks) == 0
 
-            # Should have links for reference
-            assert len(someday.links) > 0
+        # Should have links for reference
+        assert len(someday.links) > 0
 
-    def test_vault_summary_with_fixtures(self) -> None:
+    def test_vault_summary_with_fixtures(
+        self, shared_sample_vault: VaultConfig
+    ) -> None:
         """Test vault summary statistics with realistic data."""
-        with create_sample_vault() as vault_config:
-            reader = VaultReader(vault_config)
+        reader = VaultReader(shared_sample_vault)
 
-            summary = reader.get_vault_summary()
+        summary = reader.get_vault_summary()
 
-            # Should have realistic counts
-            total_files = summary["total_files"]
-            total_tasks = summary["total_tasks"]
-            total_links = summary["total_links"]
-            assert isinstance(total_files, int)
-            assert isinstance(total_tasks, int)
-            assert isinstance(total_links, int)
-            assert total_files >= 8
-            # Many tasks consolidated in next-actions
-            assert total_tasks > 20
-            assert total_links > 10
+        # Should have realistic counts
+        total_files = summary["total_files"]
+        total_tasks = summary["total_tasks"]
+        total_links = summary["total_links"]
+        assert isinstance(total_files, int)
+        assert isinstance(total_tasks, int)
+        assert isinstance(total_links, int)
+        assert total_files >= 8
+        # Many tasks consolidated in next-actions
+        assert total_tasks > 20
+        assert total_links > 10
 
-            # Should have proper file type breakdown
-            files_by_type = summary["files_by_type"]
-            assert isinstance(files_by_type, dict)
-            assert files_by_type["next-actions"] == 1
-            assert files_by_type["context"] >= 4
+        # Should have proper file type breakdown
+        files_by_type = summary["files_by_type"]
+        assert isinstance(files_by_type, dict)
+        assert files_by_type["next-actions"] == 1
+        assert files_by_type["context"] >= 4
 
-            # Should have proper task distribution
-            tasks_by_type = summary["tasks_by_type"]
-            assert isinstance(tasks_by_type, dict)
+        # Should have proper task distribution
+        tasks_by_type = summary["tasks_by_type"]
+        assert isinstance(tasks_by_type, dict)
 
-            # Most tasks should be in next-actions
-            next_actions_tasks = tasks_by_type.get("next-actions", 0)
-            assert next_actions_tasks > 15
+        # Most tasks should be in next-actions
+        next_actions_tasks = tasks_by_type.get("next-actions", 0)
+        assert next_actions_tasks > 15
 
 
 class TestContextBasedTaskFilteringWorkflow:
@@ -261,7 +364,7 @@ class TestContextBasedTaskFilteringWorkflow:
                 assert "content" not in file_data  # Lightweight overview
 
             # Verify we have the expected context files
-            file_paths = [file_data["file_path"] for file_data in files]
+            file_paths = list(map(_get_file_path, files))
             context_files = [path for path in file_paths if "contexts/" in path]
             assert len(context_files) == len(files)  # All should be in contexts folder
 
@@ -577,7 +680,7 @@ class TestContextBasedTaskFilteringWorkflow:
                         context_references.add(task["context"])
 
             # Verify context files exist for the contexts referenced in tasks
-            context_file_paths = [f["file_path"] for f in context_files]
+            context_file_paths = list(map(_get_file_path, context_files))
 
             for context_ref in context_references:
                 # Convert @calls to @calls.md format for file checking
@@ -2584,7 +2687,7 @@ class TestProjectTrackingWorkflow:
             assert len(project_links) >= 2  # Should have project name references
 
             # Create file path set for validation
-            file_paths = {f["file_path"] for f in all_files}
+            file_paths = set(map(_get_file_path, all_files))
 
             # Validate that .md file references point to existing files
             md_file_links = [
@@ -2721,7 +2824,7 @@ class TestCrossFileNavigationWorkflow:
                 )
 
             # Step 5: Validate file link targets point to actual files
-            vault_files = {f["file_path"] for f in all_files}
+            vault_files = set(map(_get_file_path, all_files))
 
             for file_link in file_links:
                 target = file_link["target"]
@@ -2996,31 +3099,28 @@ class TestCrossFileNavigationWorkflow:
                     f"Section reference in '{target}' is empty"
                 )
 
+    @pytest.mark.usefixtures("vault_green_cache")
     def test_context_link_distribution_analysis(self) -> None:
         """Test context link distribution and validate context file existence."""
         with create_sample_vault() as vault_config:
             resource_handler = ResourceHandler()
 
-            # Read all files
-            result = resource_handler.get_content(str(vault_config.vault_path))
-            assert result["status"] == "success"
-
-            all_files = result["files"]
-
-            # Extract all context links across all files
-            context_links_by_file = {}
+            # Stream the vault once, collecting context link targets from every
+            # file and probing each context file as it is read
             all_context_targets = set()
-
-            for file_data in all_files:
-                file_context_links = [
-                    link
+            context_file_names = set()
+            probes = []
+            vault_path = str(vault_config.vault_path)
+            for file_data in resource_handler.iter_content(vault_path):
+                all_context_targets.update(
+                    link["target"]
                     for link in file_data["links"]
                     if link["target"].startswith("@")
-                ]
-                if len(file_context_links) > 0:
-                    context_links_by_file[file_data["file_path"]] = file_context_links
-                    for link in file_context_links:
-                        all_context_targets.add(link["target"])
+                )
+                if file_data["file_type"] == "context":
+                    # Keep just the filename, e.g. "@calls.md"
+                    context_file_names.add(file_data["file_path"].rpartition("/")[2])
+                    probes.append(_ContextFileProbe.from_file_data(file_data))
 
             # Should have context links distributed across files
             assert len(all_context_targets) >= 3, (
@@ -3028,103 +3128,58 @@ class TestCrossFileNavigationWorkflow:
             )
 
             # Validate each context has a corresponding context file
-            context_files = [f for f in all_files if f["file_type"] == "context"]
-            context_file_names = {
-                f["file_path"].split("/")[-1] for f in context_files
-            }  # Get just filename
-
-            for context_target in all_context_targets:
-                expected_filename = f"{context_target}.md"
-                assert expected_filename in context_file_names, (
-                    f"Context '{context_target}' missing corresponding context file"
-                )
-
-            # Validate context files contain appropriate query syntax
-            for context_file in context_files:
-                content = context_file["content"]
+            expected_filenames = {f"{target}.md" for target in all_context_targets}
+            missing_filenames = expected_filenames - context_file_names
+            assert not missing_filenames, (
+                f"Contexts missing corresponding context files: {missing_filenames}"
+            )
 
+            # Validate context files contain appropriate query syntax. Each file
+            # was probed once while streaming, so these are plain checks, and
+            # every failing file is reported together.
+            failures = []
+            for probe in probes:
                 # Context files should contain Obsidian Tasks query syntax
-                assert "```tasks" in content, (
-                    f"Context file {context_file['file_path']} missing tasks "
-                    f"query block"
-                )
-                assert "not done" in content or "done" in content, (
-                    f"Context file {context_file['file_path']} missing query criteria"
-                )
-
-                # Extract context name from file path and verify it's referenced
-                # in query
-                filename = context_file["file_path"].split("/")[-1]  # e.g., "@calls.md"
-                context_name = filename.replace(".md", "")  # e.g., "@calls"
+                if not probe.has_tasks_block:
+                    failures.append(
+                        f"Context file {probe.file_path} missing tasks query block"
+                    )
+                if not probe.has_query_criterion:
+                    failures.append(
+                        f"Context file {probe.file_path} missing query criteria"
+                    )
 
                 # Query should reference this specific context
-                assert context_name in content, (
-                    f"Context file {context_file['file_path']} doesn't reference "
-                    f"its own context"
-                )
+                if not probe.references_self:
+                    failures.append(
+                        f"Context file {probe.file_path} doesn't reference its own "
+                        "context"
+                    )
+            assert not failures, "\n".join(failures[:20])
 
+    @pytest.mark.usefixtures("vault_green_cache")
     def test_link_integrity_error_scenarios(self) -> None:
         """Test link integrity validation handles edge cases and errors gracefully."""
         with create_sample_vault() as vault_config:
             resource_handler = ResourceHandler()
 
-            # Read all files
-            result = resource_handler.get_content(str(vault_config.vault_path))
-            assert result["status"] == "success"
-
-            all_files = result["files"]
-            all_links = []
-            for file_data in all_files:
-                all_links.extend(file_data["links"])
-
-            # Test that links have required attributes
-            for link in all_links:
-                assert "text" in link, "Link missing text attribute"
-                assert "target" in link, "Link missing target attribute"
-                assert "is_external" in link, "Link missing is_external attribute"
-                assert "line_number" in link, "Link missing line_number attribute"
-
-                # Validate attribute types
-                assert isinstance(link["text"], str), "Link text must be string"
-                assert isinstance(link["target"], str), "Link target must be string"
-                assert isinstance(link["is_external"], bool), (
-                    "Link is_external must be boolean"
-                )
-                assert isinstance(link["line_number"], int), (
-                    "Link line_number must be integer"
-                )
-
-                # Validate attribute values
-                assert len(link["text"]) > 0, "Link text cannot be empty"
-                assert len(link["target"]) > 0, "Link target cannot be empty"
-                assert link["line_number"] > 0, "Link line_number must be positive"
-
-            # Test link target format validation
-            internal_links = [link for link in all_links if not link["is_external"]]
-            external_links = [link for link in all_links if link["is_external"]]
-
-            # Internal links should not have URL schemes
-            for link in internal_links:
-                target = link["target"].lower()
-                assert not target.startswith("http://"), (
-                    f"Internal link '{link['target']}' has http:// scheme"
-                )
-                assert not target.startswith("https://"), (
-                    f"Internal link '{link['target']}' has https:// scheme"
-                )
-                assert not target.startswith("ftp://"), (
-                    f"Internal link '{link['target']}' has ftp:// scheme"
-                )
-
-            # External links should have proper formats
-            for link in external_links:
-                target = link["target"].lower()
-                is_valid_external = target.startswith(
-                    ("http://", "https://", "mailto:", "ftp://", "./", "../")
-                ) or target.endswith(".md")
-                assert is_valid_external, (
-                    f"External link '{link['target']}' has invalid format"
+            # Stream files one at a time, keeping only the failure messages
+            failures = []
+            vault_path = str(vault_config.vault_path)
+            for file_data in resource_handler.iter_content(vault_path):
+                # Test that links have required attributes of the right types
+                try:
+                    _LINK_LIST_ADAPTER.validate_python(file_data["links"], strict=True)
+                except ValidationError as e:
+                    failures.append(f"{file_data['file_path']}: {e}")
+                    continue
+
+                # Test link values and target formats; records give the checks
+                # attribute access
+                failures.extend(
+                    _link_errors([_Link.from_dict(link) for link in file_data["links"]])
                 )
+            assert not failures, "\n".join(failures[:20])
 
 
 class TestIncrementalVaultUpdatesWorkflow:
@@ -11,15 +11,34 @@ Key test areas:
 - Client-server communication patterns
 """
 
-import json
+import asyncio
+import re
 import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
+import orjson
 from fastmcp import FastMCP
 
 from md_gtd_mcp.server import mcp
-from tests.fixtures import create_sample_vault
+from md_gtd_mcp.services.resource_handler import ResourceHandler
+from tests.fixtures import TEST_TMP_DIR, create_sample_vault
+
+# Grammar of every resource URI the server registers: the resource kind follows
+# the vault path, with an optional file type (files, content) or a required
+# file path (file)
+_RESOURCE_URI_PATTERN = re.compile(
+    r"gtd://(?P<vault_path>.+?)/(?P<kind>files|file(?=/)|content)(?:/(?P<arg>.+))?"
+)
+
+
+def _serialize(response: dict[str, Any]) -> str:
+    """Serialize a response the way the server's resources do."""
+    return orjson.dumps(
+        response, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+    ).decode()
 
 
 class TestMCPServerIntegration(unittest.TestCase):
@@ -29,22 +48,47 @@ class TestMCPServerIntegration(unittest.TestCase):
     and handles client requests through the MCP protocol.
     """
 
-    def setUp(self) -> None:
-        """Set up test environment with sample vault."""
-        self.temp_dir = tempfile.TemporaryDirectory()
-        self.vault_path = Path(self.temp_dir.name) / "test_vault"
-        self.vault_path.mkdir(parents=True)
+    temp_dir: tempfile.TemporaryDirectory[str]
+    vault_path: Path
+    vault_state: dict[str, tuple[int, int]]
+    resource_handler: ResourceHandler
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up one sample vault shared by every read-only test in the class."""
+        cls.temp_dir = tempfile.TemporaryDirectory(dir=TEST_TMP_DIR)
+        cls.vault_path = Path(cls.temp_dir.name) / "test_vault"
+        cls.vault_path.mkdir(parents=True)
 
         # Create GTD structure for testing
-        gtd_path = self.vault_path / "gtd"
+        gtd_path = cls.vault_path / "gtd"
         gtd_path.mkdir()
-        self._create_sample_gtd_files(gtd_path)
+        cls._create_sample_gtd_files(gtd_path)
+        cls.vault_state = cls._vault_state()
 
-    def tearDown(self) -> None:
+        # One handler for the class, so its response cache spans every test
+        cls.resource_handler = ResourceHandler()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
         """Clean up test environment."""
-        self.temp_dir.cleanup()
+        cls.temp_dir.cleanup()
 
-    def _create_sample_gtd_files(self, gtd_path: Path) -> None:
+    def tearDown(self) -> None:
+        """Verify the test left the shared vault untouched."""
+        self.assertEqual(self._vault_state(), self.vault_state)
+
+    @classmethod
+    def _vault_state(cls) -> dict[str, tuple[int, int]]:
+        """Snapshot the (mtime_ns, size) of every file in the shared vault."""
+        state = {}
+        for path in cls.vault_path.rglob("*.md"):
+            stat = path.stat()
+            state[str(path)] = (stat.st_mtime_ns, stat.st_size)
+        return state
+
+    @staticmethod
+    def _create_sample_gtd_files(gtd_path: Path) -> None:
         """Create sample GTD files for server integration testing."""
         # Inbox file
         inbox_file = gtd_path / "inbox.md"
@@ -103,6 +147,13 @@ class TestMCPServerIntegration(unittest.TestCase):
         self.assertIn("Resource URI Patterns", instructions or "")
         self.assertIn("Claude Desktop", instructions or "")
 
+        # Every registered resource template follows the resource URI grammar
+        templates = asyncio.run(mcp.get_resource_templates())
+        self.assertEqual(len(templates), 5)
+        for uri_template in templates:
+            with self.subTest(uri_template=uri_template):
+                self.assertIsNotNone(_RESOURCE_URI_PATTERN.fullmatch(uri_template))
+
     def test_resource_template_uri_patterns(self) -> None:
         """Test that resource templates are registered with correct URI patterns.
 
@@ -111,36 +162,25 @@ class TestMCPServerIntegration(unittest.TestCase):
         """
         vault_path_str = str(self.vault_path)
 
-        # Expected resource URI patterns
-        expected_patterns = [
-            f"gtd://{vault_path_str}/files",
-            f"gtd://{vault_path_str}/files/inbox",
-            f"gtd://{vault_path_str}/file/gtd/inbox.md",
-            f"gtd://{vault_path_str}/content",
-            f"gtd://{vault_path_str}/content/projects",
-        ]
+        # Expected resource URI patterns with their (kind, argument)
+        expected_patterns = {
+            f"gtd://{vault_path_str}/files": ("files", None),
+            f"gtd://{vault_path_str}/files/inbox": ("files", "inbox"),
+            f"gtd://{vault_path_str}/file/gtd/inbox.md": ("file", "gtd/inbox.md"),
+            f"gtd://{vault_path_str}/content": ("content", None),
+            f"gtd://{vault_path_str}/content/projects": ("content", "projects"),
+        }
 
         # Test that each pattern would be valid for MCP routing
         # This tests the URI pattern structure without actual MCP calls
-        for pattern in expected_patterns:
+        for pattern, (kind, arg) in expected_patterns.items():
             with self.subTest(pattern=pattern):
-                # Validate URI structure
-                self.assertTrue(pattern.startswith("gtd://"))
-
-                # Extract and validate components
-                path_part = pattern.replace("gtd://", "")
-                components = path_part.split("/")
-
-                # Should have vault path as first component
-                self.assertTrue(len(components) >= 2)
+                match = _RESOURCE_URI_PATTERN.fullmatch(pattern)
+                assert match is not None, pattern
 
-                # Validate component types
-                if "/files/" in pattern or pattern.endswith("/files"):
-                    self.assertIn("files", components)
-                elif "/file/" in pattern:
-                    self.assertIn("file", components)
-                elif "/content/" in pattern or pattern.endswith("/content"):
-                    self.assertIn("content", components)
+                self.assertEqual(match["vault_path"], vault_path_str)
+                self.assertEqual(match["kind"], kind)
+                self.assertEqual(match["arg"], arg)
 
     def test_server_instructions_for_claude_desktop(self) -> None:
         """Test server instructions provide proper guidance for Claude Desktop.
@@ -182,9 +222,7 @@ class TestMCPServerIntegration(unittest.TestCase):
         # that would use the annotations
         try:
             # Simulate repeated access (idempotent behavior)
-            from md_gtd_mcp.services.resource_handler import ResourceHandler
-
-            resource_handler = ResourceHandler()
+            resource_handler = self.resource_handler
 
             # Multiple calls should work without issues (idempotent)
             for _ in range(3):
@@ -204,9 +242,7 @@ class TestMCPServerIntegration(unittest.TestCase):
         Validates that the server provides appropriate error responses
         for common client error scenarios.
         """
-        from md_gtd_mcp.services.resource_handler import ResourceHandler
-
-        resource_handler = ResourceHandler()
+        resource_handler = self.resource_handler
 
         # Test invalid vault path
         invalid_result = resource_handler.get_files("/nonexistent/vault")
@@ -214,8 +250,8 @@ class TestMCPServerIntegration(unittest.TestCase):
 
         # Test that error responses are JSON-serializable for MCP transport
         try:
-            json.dumps(invalid_result)
-        except (TypeError, ValueError) as e:
+            orjson.dumps(invalid_result)
+        except orjson.JSONEncodeError as e:
             self.fail(f"Error response not JSON-serializable: {e}")
 
         # Test invalid file type
@@ -227,8 +263,8 @@ class TestMCPServerIntegration(unittest.TestCase):
 
         # Should be JSON-serializable
         try:
-            json.dumps(invalid_type_result)
-        except (TypeError, ValueError) as e:
+            orjson.dumps(invalid_type_result)
+        except orjson.JSONEncodeError as e:
             self.fail(f"Error response not JSON-serializable: {e}")
 
     def test_json_response_format_for_mcp_transport(self) -> None:
@@ -237,9 +273,7 @@ class TestMCPServerIntegration(unittest.TestCase):
         Validates that resource responses are JSON-serializable and follow
         consistent format for MCP client consumption.
         """
-        from md_gtd_mcp.services.resource_handler import ResourceHandler
-
-        resource_handler = ResourceHandler()
+        resource_handler = self.resource_handler
 
         vault_path_str = str(self.vault_path)
 
@@ -267,10 +301,9 @@ class TestMCPServerIntegration(unittest.TestCase):
 
                 # Should be JSON-serializable for MCP transport
                 try:
-                    json_str = json.dumps(result)
-                    parsed_back = json.loads(json_str)
+                    parsed_back = orjson.loads(orjson.dumps(result))
                     self.assertEqual(result, parsed_back)
-                except (TypeError, ValueError) as e:
+                except orjson.JSONEncodeError as e:
                     self.fail(f"{test_name} response not JSON-serializable: {e}")
 
                 # Should have consistent MCP response structure
@@ -283,33 +316,35 @@ class TestMCPServerIntegration(unittest.TestCase):
         Simulates multiple MCP clients accessing resources simultaneously
         to validate thread safety and consistent responses.
         """
-        from md_gtd_mcp.services.resource_handler import ResourceHandler
-
-        resource_handler = ResourceHandler()
+        resource_handler = self.resource_handler
 
         vault_path_str = str(self.vault_path)
 
-        # Simulate concurrent client access
-        results = []
-
-        # Multiple "clients" accessing same resource
-        for _ in range(10):
-            result = resource_handler.get_files(vault_path_str)
-            results.append(result)
-
-        # All results should be identical (no race conditions)
-        first_result = results[0]
-        for i, result in enumerate(results[1:], 1):
-            try:
-                self.assertEqual(result, first_result)
-            except AssertionError:
-                self.fail(
-                    f"Result {i} differs from first result - potential race condition"
+        def client(_: int) -> tuple[str, str]:
+            """Fetch the cached JSON and serialize a freshly built response."""
+            return (
+                resource_handler.get_files_json(vault_path_str),
+                _serialize(resource_handler.get_files(vault_path_str)),
+            )
+
+        # Multiple "clients" accessing same resource from their own threads
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            results = list(executor.map(client, range(10)))
+
+        # Every response must match one built independently of the shared
+        # handler and its cache
+        expected = _serialize(ResourceHandler().get_files(vault_path_str))
+        for i, (cached_json, built_json) in enumerate(results):
+            for result in (cached_json, built_json):
+                self.assertEqual(
+                    result,
+                    expected,
+                    f"Result {i} differs from an independent build - potential "
+                    "race condition",
                 )
 
-        # All should be successful
-        for i, result in enumerate(results):
-            self.assertEqual(result["status"], "success", f"Result {i} failed")
+        # The expected response should be successful
+        self.assertEqual(orjson.loads(expected)["status"], "success")
 
     def test_mcp_client_caching_behavior_simulation(self) -> None:
         """Test behavior that MCP clients would rely on for caching.
@@ -317,24 +352,15 @@ class TestMCPServerIntegration(unittest.TestCase):
         Validates idempotent behavior and response consistency that
         MCP clients use for caching optimizations.
         """
-        from md_gtd_mcp.services.resource_handler import ResourceHandler
-
-        resource_handler = ResourceHandler()
+        resource_handler = self.resource_handler
 
         vault_path_str = str(self.vault_path)
 
         # Get baseline response
         baseline = resource_handler.get_files(vault_path_str)
 
-        # Simulate client caching behavior - multiple access over time
-        import time
-
-        responses = []
-
-        for _ in range(5):
-            time.sleep(0.01)  # Small delay to simulate time passage
-            response = resource_handler.get_files(vault_path_str)
-            responses.append(response)
+        # Determinism: identical inputs -> identical outputs
+        responses = [resource_handler.get_files(vault_path_str) for _ in range(5)]
 
         # All responses should be identical (suitable for caching)
         for response in responses:
@@ -366,24 +392,31 @@ class TestMCPProtocolCompliance(unittest.TestCase):
 
         for uri in expected_uris:
             with self.subTest(uri=uri):
-                # Should start with custom scheme
-                self.assertTrue(uri.startswith("gtd://"))
-
-                # Should not contain spaces or invalid characters
-                self.assertNotIn(" ", uri)
-                self.assertNotIn("\n", uri)
-                self.assertNotIn("\t", uri)
+                # Should be whitespace-free and routable to a registered resource
+                self.assertNotRegex(uri, r"\s")
+                match = _RESOURCE_URI_PATTERN.fullmatch(uri)
+                assert match is not None, uri
+                self.assertEqual(match["vault_path"], test_vault)
+
+    def test_malformed_resource_uris_are_not_routable(self) -> None:
+        """Test that malformed URIs do not match any registered resource."""
+        malformed_uris = [
+            "http://test/vault/files",
+            "gtd://test/vault",
+            "gtd://test/vault/notes",
+            "gtd://test/vault/file",
+            "gtd:///files",
+            "gtd://test/vault/files\n",
+            "gtd://test\nvault/content",
+        ]
 
-                # Should be parseable
-                scheme, path = uri.split("://", 1)
-                self.assertEqual(scheme, "gtd")
-                self.assertTrue(len(path) > 0)
+        for uri in malformed_uris:
+            with self.subTest(uri=uri):
+                self.assertIsNone(_RESOURCE_URI_PATTERN.fullmatch(uri))
 
     def test_resource_response_structure_compliance(self) -> None:
         """Test that resource responses follow MCP protocol structure."""
         with create_sample_vault() as vault_config:
-            from md_gtd_mcp.services.resource_handler import ResourceHandler
-
             resource_handler = ResourceHandler()
 
             vault_path = str(vault_config.vault_path)
@@ -402,8 +435,8 @@ class TestMCPProtocolCompliance(unittest.TestCase):
 
             # Should be serializable for MCP transport
             try:
-                json.dumps(result)
-            except (TypeError, ValueError) as e:
+                orjson.dumps(result)
+            except orjson.JSONEncodeError as e:
                 self.fail(f"Resource response not MCP-compatible: {e}")
 
 
@@ -1,12 +1,18 @@
 """Tests for ResourceHandler service with URI parsing and data consistency."""
 
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 from unittest.mock import Mock, patch
 
+import orjson
 import pytest
 
 from md_gtd_mcp.services.resource_handler import ResourceHandler
+from md_gtd_mcp.services.vault_reader import VaultReader
+from tests.fixtures import create_sample_vault
 
 
 class TestResourceHandler:
@@ -425,12 +431,9 @@ class TestResourceHandlerErrorHandling:
         assert result["status"] == "error"
         assert "cannot be empty" in result["error"]
 
-        # Test empty file path with temporary valid vault
+        # Test empty file path with the temporary directory as a valid vault
         with tempfile.TemporaryDirectory() as temp_dir:
-            vault_path = Path(temp_dir) / "test_vault"
-            vault_path.mkdir()
-
-            result = self.resource_handler.get_file(str(vault_path), "")
+            result = self.resource_handler.get_file(temp_dir, "")
             assert result["status"] == "error"
             assert "cannot be empty" in result["error"]
 
@@ -519,7 +522,7 @@ class TestResourceHandlerFiltering:
             mock_gtd_file.file_type = "projects"
             mock_gtd_file.content = "# Projects\n\n- [ ] Test project #task"
             mock_gtd_file.frontmatter = None
-            mock_gtd_file.tasks = [Mock()]
+            mock_gtd_file.tasks = [Mock(tags=["#task"])]
             mock_gtd_file.links = []
 
             mock_vault_reader.list_gtd_files.return_value = [mock_gtd_file]
@@ -545,3 +548,386 @@ class TestResourceHandlerFiltering:
             assert len(result["files"]) == 1
             assert result["files"][0]["file_type"] == "projects"
             assert "content" in result["files"][0]
+
+
+class TestResourceHandlerStreaming:
+    """Test streaming file content one file at a time."""
+
+    def setup_method(self) -> None:
+        """Set up ResourceHandler for streaming tests."""
+        self.resource_handler = ResourceHandler()
+
+    def test_iter_content_matches_get_content(self) -> None:
+        """Test iter_content yields the same file entries as get_content."""
+        with create_sample_vault() as vault_config:
+            vault_path = str(vault_config.vault_path)
+
+            streamed_files = list(self.resource_handler.iter_content(vault_path))
+            content_result = self.resource_handler.get_content(vault_path)
+
+            assert streamed_files == content_result["files"]
+
+    def test_iter_content_with_filter(self) -> None:
+        """Test iter_content only yields files of the requested type."""
+        with create_sample_vault() as vault_config:
+            vault_path = str(vault_config.vault_path)
+
+            context_files = list(
+                self.resource_handler.iter_content(vault_path, file_type="context")
+            )
+
+            assert len(context_files) == 4
+            for file_data in context_files:
+                assert file_data["file_type"] == "context"
+
+    def test_iter_content_invalid_vault_path(self) -> None:
+        """Test iter_content raises ValueError for an invalid vault path."""
+        with pytest.raises(ValueError, match="cannot be empty"):
+            list(self.resource_handler.iter_content(""))
+
+
+class TestResourceHandlerCaching:
+    """Test memoization of responses between vault changes."""
+
+    def setup_method(self) -> None:
+        """Set up ResourceHandler for caching tests."""
+        self.resource_handler = ResourceHandler()
+
+    def test_repeated_calls_skip_reading_unchanged_vault(self) -> None:
+        """Test repeated requests on an unchanged vault reuse the cached response."""
+        with create_sample_vault() as vault_config:
+            vault_path = str(vault_config.vault_path)
+
+            first_json = self.resource_handler.get_content_json(vault_path)
+
+            with patch(
+                "md_gtd_mcp.services.resource_handler.VaultReader"
+            ) as mock_vault_reader:
+                second_json = self.resource_handler.get_content_json(vault_path)
+
+            mock_vault_reader.assert_not_called()
+            assert second_json == first_json
+
+    def test_vault_changes_invalidate_cache(self) -> None:
+        """Test editing a GTD file produces a fresh response."""
+        with create_sample_vault() as vault_config:
+            vault_path = str(vault_config.vault_path)
+            inbox_path = vault_config.get_inbox_path()
+
+            first_result = orjson.loads(
+                self.resource_handler.get_files_json(vault_path, "inbox")
+            )
+
+            inbox_path.write_text(
+                inbox_path.read_text(encoding="utf-8")
+                + "\n- [ ] Newly captured item #task\n",
+                encoding="utf-8",
+            )
+            second_result = orjson.loads(
+                self.resource_handler.get_files_json(vault_path, "inbox")
+            )
+
+            first_count = first_result["files"][0]["task_count"]
+            assert second_result["files"][0]["task_count"] == first_count + 1
+
+    def test_creating_gtd_folder_invalidates_cache(self, tmp_path: Path) -> None:
+        """Test the missing-structure suggestion is dropped once gtd/ exists."""
+        vault_path = str(tmp_path)
+
+        first_result = orjson.loads(self.resource_handler.get_files_json(vault_path))
+        assert "suggestion" in first_result
+
+        (tmp_path / "gtd").mkdir()
+        second_result = orjson.loads(self.resource_handler.get_files_json(vault_path))
+
+        assert "suggestion" not in second_result
+        assert second_result == self.resource_handler.get_files(vault_path)
+
+    def test_responses_cannot_be_mutated_by_callers(self) -> None:
+        """Test changes to a returned response do not leak into later calls."""
+        with create_sample_vault() as vault_config:
+            vault_path = str(vault_config.vault_path)
+            expected_json = self.resource_handler.get_content_json(vault_path)
+
+            first_result = self.resource_handler.get_content(vault_path)
+            first_result["files"][0]["tasks"][0]["tags"].append("#mutated")
+            first_result["files"].clear()
+
+            second_result = self.resource_handler.get_content(vault_path)
+            assert second_result == orjson.loads(expected_json)
+            assert self.resource_handler.get_content_json(vault_path) == expected_json
+
+    def test_get_content_reads_each_file_once(self) -> None:
+        """Test a cold get_content reads every file once and warm views none."""
+        with create_sample_vault() as vault_config:
+            vault_path = str(vault_config.vault_path)
+
+            with patch.object(
+                Path, "read_text", autospec=True, wraps=Path.read_text
+            ) as read_text:
+                result = self.resource_handler.get_content(vault_path)
+                assert read_text.call_count == len(result["files"])
+
+                read_text.reset_mock()
+                self.resource_handler.get_content(vault_path)
+                self.resource_handler.get_files(vault_path, "inbox")
+                read_text.assert_not_called()
+
+    def test_narrower_views_derive_from_cached_content(self) -> None:
+        """Test filtered and metadata views are projected without re-reading."""
+        with create_sample_vault() as vault_config:
+            vault_path = str(vault_config.vault_path)
+            expected = {
+                (method, file_type): getattr(ResourceHandler(), method)(
+                    vault_path, file_type
+                )
+                for method in ("get_files_json", "get_content_json")
+                for file_type in (None, "inbox", "context", "unknown")
+            }
+
+            self.resource_handler.get_content_json(vault_path)
+
+            with patch(
+                "md_gtd_mcp.services.resource_handler.VaultReader"
+            ) as mock_vault_reader:
+                for (method, file_type), result in expected.items():
+                    derived = getattr(self.resource_handler, method)(
+                        vault_path, file_type
+                    )
+                    assert derived == result
+
+            mock_vault_reader.assert_not_called()
+
+    def test_concurrent_requests_build_response_once(self) -> None:
+        """Test simultaneous requests on a cold cache read the vault only once."""
+        with create_sample_vault() as vault_config:
+            vault_path = str(vault_config.vault_path)
+
+            with patch(
+                "md_gtd_mcp.services.resource_handler.VaultReader",
+                wraps=VaultReader,
+            ) as mock_vault_reader:
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    results = list(
+                        executor.map(
+                            lambda _: self.resource_handler.get_content_json(
+                                vault_path
+                            ),
+                            range(8),
+                        )
+                    )
+
+            assert mock_vault_reader.call_count == 1
+            assert all(result == results[0] for result in results)
+
+    def test_slow_build_does_not_block_other_vaults(self) -> None:
+        """Test a cold read of one vault does not hold up requests for another."""
+        release = threading.Event()
+
+        class SlowHandler(ResourceHandler):
+            def _read_content(
+                self, vault_path: str, file_type: str | None
+            ) -> dict[str, Any]:
+                if vault_path == slow_path:
+                    release.wait(timeout=10)
+                return super()._read_content(vault_path, file_type)
+
+        handler = SlowHandler()
+        with create_sample_vault() as slow_config, create_sample_vault() as config:
+            slow_path = str(slow_config.vault_path)
+
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                slow_result = executor.submit(handler.get_content_json, slow_path)
+                try:
+                    other_json = handler.get_content_json(str(config.vault_path))
+                    assert not slow_result.done()
+                finally:
+                    release.set()
+
+                assert orjson.loads(slow_result.result())["status"] == "success"
+            assert orjson.loads(other_json)["status"] == "success"
+
+    def test_default_returns_shared_handler(self) -> None:
+        """Test default() hands every caller the same instance and cache."""
+        handler = ResourceHandler.default()
+        assert ResourceHandler.default() is handler
+
+        with create_sample_vault() as vault_config:
+            vault_path = str(vault_config.vault_path)
+            first_json = handler.get_files_json(vault_path)
+
+            with patch(
+                "md_gtd_mcp.services.resource_handler.VaultReader"
+            ) as mock_vault_reader:
+                second_json = ResourceHandler.default().get_files_json(vault_path)
+
+            mock_vault_reader.assert_not_called()
+            assert second_json == first_json
+
+
+class TestResourceHandlerFileByType:
+    """Test reading standard GTD files by type without listing the vault."""
+
+    def setup_method(self) -> None:
+        """Set up ResourceHandler for file-by-type tests."""
+        self.resource_handler = ResourceHandler()
+
+    def test_get_file_by_type_matches_get_file(self) -> None:
+        """Test get_file_by_type returns the same data as get_file."""
+        with create_sample_vault() as vault_config:
+            vault_path = str(vault_config.vault_path)
+
+            result = self.resource_handler.get_file_by_type(vault_path, "inbox")
+            expected = self.resource_handler.get_file(
+                vault_path, str(vault_config.get_inbox_path())
+            )
+
+            assert result["status"] == "success"
+            assert result == expected
+            assert result["file"]["file_type"] == "inbox"
+
+    def test_get_file_by_type_rejects_multi_file_types(self) -> None:
+        """Test types without a single standard file return an error."""
+        with create_sample_vault() as vault_config:
+            vault_path = str(vault_config.vault_path)
+
+            result = self.resource_handler.get_file_by_type(vault_path, "context")
+
+            assert result["status"] == "error"
+            assert "get_files" in result["error"]
+
+    def test_get_file_by_type_invalid_vault_path(self) -> None:
+        """Test get_file_by_type reports an invalid vault path."""
+        result = self.resource_handler.get_file_by_type("", "inbox")
+
+        assert result["status"] == "error"
+        assert "cannot be empty" in result["error"]
+
+
+class TestResourceHandlerFilesByType:
+    """Test the file type index included in list responses."""
+
+    def setup_method(self) -> None:
+        """Set up ResourceHandler for file type index tests."""
+        self.resource_handler = ResourceHandler()
+
+    def test_files_by_type_indexes_file_paths(self) -> None:
+        """Test files_by_type maps each type to the paths of its files."""
+        with create_sample_vault() as vault_config:
+            vault_path = str(vault_config.vault_path)
+
+            for result in (
+                self.resource_handler.get_files(vault_path),
+                self.resource_handler.get_content(vault_path),
+            ):
+                expected: dict[str, list[str]] = {}
+                for file_data in result["files"]:
+                    expected.setdefault(file_data["file_type"], []).append(
+                        file_data["file_path"]
+                    )
+
+                assert result["files_by_type"] == expected
+                assert len(result["files_by_type"]["context"]) == 4
+
+    def test_files_by_type_with_filter(self) -> None:
+        """Test files_by_type only contains the requested type when filtered."""
+        with create_sample_vault() as vault_config:
+            vault_path = str(vault_config.vault_path)
+
+            result = self.resource_handler.get_files(vault_path, file_type="inbox")
+
+            assert list(result["files_by_type"]) == ["inbox"]
+            assert result["files_by_type"]["inbox"] == [
+                str(vault_config.get_inbox_path())
+            ]
+
+
+class TestResourceHandlerSummary:
+    """Test summary statistics attached to list responses."""
+
+    def setup_method(self) -> None:
+        """Set up ResourceHandler for summary tests."""
+        self.resource_handler = ResourceHandler()
+
+    def test_unfiltered_summary_built_from_listed_files(self) -> None:
+        """Test unfiltered responses summarize the files they already read."""
+        with create_sample_vault() as vault_config:
+            vault_path = str(vault_config.vault_path)
+
+            with patch(
+                "md_gtd_mcp.services.vault_reader.VaultReader.get_vault_summary"
+            ) as mock_get_vault_summary:
+                result = self.resource_handler.get_content(vault_path)
+
+            mock_get_vault_summary.assert_not_called()
+            summary = result["summary"]
+            assert summary["total_files"] == len(result["files"])
+            assert summary["total_tasks"] == sum(
+                f["task_count"] for f in result["files"]
+            )
+            assert summary["total_links"] == sum(
+                f["link_count"] for f in result["files"]
+            )
+
+    def test_filtered_summary_covers_whole_vault(self) -> None:
+        """Test filtered responses still summarize the whole vault."""
+        with create_sample_vault() as vault_config:
+            vault_path = str(vault_config.vault_path)
+
+            full_result = self.resource_handler.get_files(vault_path)
+            inbox_result = self.resource_handler.get_files(vault_path, "inbox")
+
+            assert len(inbox_result["files"]) == 1
+            assert inbox_result["summary"] == full_result["summary"]
+
+
+class TestResourceHandlerJsonResponses:
+    """Test serialized responses used by the MCP resources."""
+
+    def setup_method(self) -> None:
+        """Set up ResourceHandler for JSON response tests."""
+        self.resource_handler = ResourceHandler()
+
+    def test_json_matches_response(self) -> None:
+        """Test JSON responses decode to the matching dictionary responses."""
+        with create_sample_vault() as vault_config:
+            vault_path = str(vault_config.vault_path)
+
+            files_json = self.resource_handler.get_files_json(vault_path, "inbox")
+            content_json = self.resource_handler.get_content_json(vault_path)
+            file_json = self.resource_handler.get_file_json(vault_path, "gtd/inbox.md")
+
+            assert orjson.loads(files_json) == self.resource_handler.get_files(
+                vault_path, "inbox"
+            )
+            assert orjson.loads(content_json) == self.resource_handler.get_content(
+                vault_path
+            )
+            assert orjson.loads(file_json) == self.resource_handler.get_file(
+                vault_path, "gtd/inbox.md"
+            )
+
+    def test_json_reused_until_vault_changes(self) -> None:
+        """Test serialized text is reused for an unchanged vault only."""
+        with create_sample_vault() as vault_config:
+            vault_path = str(vault_config.vault_path)
+            inbox_path = vault_config.get_inbox_path()
+
+            first_json = self.resource_handler.get_files_json(vault_path)
+            second_json = self.resource_handler.get_files_json(vault_path)
+            assert second_json is first_json
+
+            inbox_path.write_text(
+                inbox_path.read_text(encoding="utf-8")
+                + "\n- [ ] Newly captured item #task\n",
+                encoding="utf-8",
+            )
+            third_json = self.resource_handler.get_files_json(vault_path)
+            assert third_json != first_json
+
+    def test_json_error_response(self) -> None:
+        """Test errors are serialized without being cached."""
+        result = orjson.loads(self.resource_handler.get_content_json(""))
+
+        assert result["status"] == "error"
+        assert "cannot be empty" in result["error"]